@@ -1,12 +1,18 @@
 """
 Data Transfer Objects for Authentication application layer
 """
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+# Compiled once; a bare '@' check let values like "a@" through.
+# Use fullmatch, match with '$' would accept a trailing newline
+EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+
+@dataclass(slots=True, frozen=True)
 class LoginRequestDTO:
     """DTO for login request"""
     email: str
@@ -15,24 +21,21 @@ class LoginRequestDTO:
     user_agent: Optional[str] = None
     
     def validate(self) -> list[str]:
-        """Validate login request data"""
-        errors = []
-        
+        """Validate login request data, stopping at the first failed rule"""
+        # Cheapest checks first; the regex only runs on a present email
         if not self.email:
-            errors.append("Email is required")
-        elif '@' not in self.email:
-            errors.append("Valid email address is required")
-        
+            return ["Email is required"]
         if not self.password:
-            errors.append("Password is required")
-        
+            return ["Password is required"]
         if not self.ip_address:
-            errors.append("IP address is required")
+            return ["IP address is required"]
+        if not EMAIL_RE.fullmatch(self.email):
+            return ["Valid email address is required"]
         
-        return errors
+        return []
 
 
-@dataclass
+@dataclass(slots=True)
 class LoginResponseDTO:
     """DTO for login response"""
     success: bool
@@ -44,9 +47,11 @@ class LoginResponseDTO:
     requires_verification: bool = False
     account_locked: bool = False
     expires_at: Optional[datetime] = None
+    user_name: Optional[str] = None
+    user_email: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RefreshTokenRequestDTO:
     """DTO for token refresh request"""
     refresh_token: str
@@ -61,7 +66,7 @@ class RefreshTokenRequestDTO:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class RefreshTokenResponseDTO:
     """DTO for token refresh response"""
     success: bool
@@ -70,7 +75,7 @@ class RefreshTokenResponseDTO:
     expires_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LogoutRequestDTO:
     """DTO for logout request"""
     user_id: str
@@ -78,7 +83,7 @@ class LogoutRequestDTO:
     revoke_all_sessions: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidateTokenRequestDTO:
     """DTO for token validation request"""
     token: str
@@ -93,7 +98,7 @@ class ValidateTokenRequestDTO:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidateTokenResponseDTO:
     """DTO for token validation response"""
     valid: bool
@@ -103,7 +108,7 @@ class ValidateTokenResponseDTO:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PasswordResetRequestDTO:
     """DTO for password reset request"""
     email: str
@@ -114,13 +119,13 @@ class PasswordResetRequestDTO:
         
         if not self.email:
             errors.append("Email is required")
-        elif '@' not in self.email:
+        elif not EMAIL_RE.fullmatch(self.email):
             errors.append("Valid email address is required")
         
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class PasswordResetResponseDTO:
     """DTO for password reset response"""
     success: bool
@@ -128,7 +133,7 @@ class PasswordResetResponseDTO:
     token: Optional[str] = None  # Only for testing, not returned in production
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResetPasswordRequestDTO:
     """DTO for password reset confirmation"""
     token: str
@@ -149,7 +154,7 @@ class ResetPasswordRequestDTO:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionDTO:
     """DTO for session representation"""
     session_id: str
@@ -163,7 +168,7 @@ class SessionDTO:
     is_current: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityEventDTO:
     """DTO for security event representation"""
     id: str
@@ -177,7 +182,7 @@ class SecurityEventDTO:
     metadata: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LoginAttemptDTO:
     """DTO for login attempt representation"""
     id: str
@@ -2,9 +2,10 @@
 Authentication use cases - Application layer orchestrating auth business logic
 """
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from ..domain.services import AuthenticationDomainService, AuthenticationValidationService
+from ..domain.services import AuthenticationDomainService
+from ..domain.notifications import AuthNotificationService
 from ..domain.repositories import (
     AuthTokenRepository, LoginAttemptRepository, AuthSessionRepository, SecurityEventRepository
 )
@@ -30,7 +31,6 @@ class LoginUseCase:
         self._user_repository = user_repository
         self._user_domain_service = user_domain_service
         self._auth_domain_service = auth_domain_service
-        self._validation_service = AuthenticationValidationService()
     
     def execute(self, dto: LoginRequestDTO) -> LoginResponseDTO:
         """Execute user login"""
@@ -42,8 +42,12 @@ class LoginUseCase:
                 error_message=f"Validation failed: {', '.join(validation_errors)}"
             )
         
-        # Check rate limiting
-        if self._auth_domain_service.is_ip_rate_limited(dto.ip_address):
+        # Check rate limiting, both limits come from a single lookup
+        ip_limited, email_limited = self._auth_domain_service.check_rate_limits(
+            dto.ip_address, dto.email
+        )
+        
+        if ip_limited:
             self._auth_domain_service.record_login_attempt(
                 email=dto.email,
                 ip_address=dto.ip_address,
@@ -56,7 +60,7 @@ class LoginUseCase:
                 error_message="Too many login attempts from this IP address. Please try again later."
             )
         
-        if self._auth_domain_service.is_email_rate_limited(dto.email):
+        if email_limited:
             self._auth_domain_service.record_login_attempt(
                 email=dto.email,
                 ip_address=dto.ip_address,
@@ -92,7 +96,7 @@ class LoginUseCase:
                 )
             
             # Generate tokens
-            access_token, refresh_token = self._auth_domain_service.generate_jwt_tokens(user.id)
+            access_token, refresh_token, expires_at = self._auth_domain_service.generate_jwt_tokens(user.id)
             
             # Create session
             session = self._auth_domain_service.create_session(
@@ -116,7 +120,9 @@ class LoginUseCase:
                 refresh_token=refresh_token,
                 user_id=user.id,
                 session_id=session.session_id,
-                expires_at=datetime.now() + timedelta(hours=1)
+                expires_at=expires_at,
+                user_name=user.name,
+                user_email=user.email
             )
             
         except ValueError as e:
@@ -157,18 +163,19 @@ class RefreshTokenUseCase:
             )
         
         # Refresh token
-        new_access_token = self._auth_domain_service.refresh_access_token(dto.refresh_token)
+        refreshed = self._auth_domain_service.refresh_access_token(dto.refresh_token)
         
-        if not new_access_token:
+        if not refreshed:
             return RefreshTokenResponseDTO(
                 success=False,
                 error_message="Invalid or expired refresh token"
             )
         
+        new_access_token, expires_at = refreshed
         return RefreshTokenResponseDTO(
             success=True,
             access_token=new_access_token,
-            expires_at=datetime.now() + timedelta(hours=1)
+            expires_at=expires_at
         )
 
 
@@ -229,10 +236,12 @@ class PasswordResetRequestUseCase:
     def __init__(
         self,
         user_repository: UserRepository,
-        auth_domain_service: AuthenticationDomainService
+        auth_domain_service: AuthenticationDomainService,
+        notification_service: AuthNotificationService
     ):
         self._user_repository = user_repository
         self._auth_domain_service = auth_domain_service
+        self._notification_service = notification_service
     
     def execute(self, dto: PasswordResetRequestDTO) -> PasswordResetResponseDTO:
         """Execute password reset request"""
@@ -244,8 +253,8 @@ class PasswordResetRequestUseCase:
                 message=f"Validation failed: {', '.join(validation_errors)}"
             )
         
-        # Find user
-        user = self._user_repository.find_by_email(dto.email)
+        # Only the contact columns are needed to issue a reset link
+        user = self._user_repository.find_active_contact_by_email(dto.email)
         
         # Always return success for security (don't reveal if email exists)
         if not user:
@@ -257,8 +266,8 @@ class PasswordResetRequestUseCase:
         # Generate reset token
         token = self._auth_domain_service.generate_password_reset_token(user.id, user.email)
         
-        # In a real implementation, you would send an email here
-        # For now, we'll just return success
+        # Email is delivered in the background so the response does not wait on SMTP
+        self._notification_service.send_password_reset(user.email, user.name, token)
         
         return PasswordResetResponseDTO(
             success=True,
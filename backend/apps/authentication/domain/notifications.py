@@ -0,0 +1,13 @@
+"""
+Authentication notification interfaces - Abstract contracts for user notifications
+"""
+from abc import ABC, abstractmethod
+
+
+class AuthNotificationService(ABC):
+    """Abstract service for authentication related notifications"""
+    
+    @abstractmethod
+    def send_password_reset(self, email: str, name: str, token: str) -> None:
+        """Send a password reset link to the user"""
+        pass
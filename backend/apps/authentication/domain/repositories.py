@@ -2,7 +2,7 @@
 Authentication repository interfaces - Abstract contracts for auth data access
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from .entities import AuthToken, LoginAttempt, AuthSession, PasswordResetRequest, SecurityEvent
 
@@ -15,6 +15,11 @@ class AuthTokenRepository(ABC):
         """Save an authentication token"""
         pass
     
+    @abstractmethod
+    def save_tokens(self, tokens: List[AuthToken]) -> List[AuthToken]:
+        """Save several authentication tokens in one batch"""
+        pass
+    
     @abstractmethod
     def find_token(self, token: str) -> Optional[AuthToken]:
         """Find a token by its value"""
@@ -60,8 +65,8 @@ class LoginAttemptRepository(ABC):
         pass
     
     @abstractmethod
-    def get_failed_attempts_count(self, email: str, minutes: int = 15) -> int:
-        """Get count of failed attempts for email in time window"""
+    def get_failed_attempt_counts(self, ip_address: str, email: str) -> Tuple[int, int]:
+        """Get counts of recent failed attempts for an IP and an email in one lookup"""
         pass
 
 
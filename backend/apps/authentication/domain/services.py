@@ -1,23 +1,75 @@
 """
 Authentication domain services - Complex business logic for auth
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+import base64
+import hmac
+import json
+import os
 import secrets
+import time
 import hashlib
 import jwt
 from django.conf import settings
 
 from .entities import (
     AuthToken, TokenType, LoginAttempt, AuthSession, PasswordResetRequest,
-    SecurityEvent, AuthenticationResult, AuthenticationMethod
+    SecurityEvent, AuthenticationMethod
 )
 from .repositories import (
     AuthTokenRepository, LoginAttemptRepository, AuthSessionRepository,
-    PasswordResetRepository, SecurityEventRepository
+    SecurityEventRepository
 )
 
 
+_ONE_HOUR = timedelta(hours=1)
+_SEVEN_DAYS = timedelta(days=7)
+
+
+def _mint_jtis(count: int) -> List[str]:
+    """Generate count random JWT ids from a single urandom read"""
+    raw = os.urandom(16 * count)
+    return [raw[i * 16:(i + 1) * 16].hex() for i in range(count)]
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded URL-safe base64, as used by JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+# The HS256 header never changes, encode it once
+_JWT_HEADER = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+# json.dumps builds a new encoder per call when given separators
+_compact_json = json.JSONEncoder(separators=(',', ':')).encode
+
+
+@lru_cache(maxsize=4)
+def _hmac_template(key: str):
+    """HMAC-SHA256 state with the key already absorbed, cloned per signature"""
+    return hmac.new(key.encode(), digestmod=hashlib.sha256)
+
+
+def _encode_jwt(payload: dict) -> str:
+    """Sign a payload as an HS256 JWT"""
+    # Same output format as jwt.encode, without its per-call header and
+    # algorithm handling; hmac runs on OpenSSL's SHA-256
+    signing_input = _JWT_HEADER + b'.' + _b64url(_compact_json(payload).encode())
+    mac = _hmac_template(settings.SECRET_KEY).copy()
+    mac.update(signing_input)
+    signature = mac.digest()
+    return (signing_input + b'.' + _b64url(signature)).decode()
+
+
+@lru_cache(maxsize=10_000)
+def _decode_jwt(token: str) -> dict:
+    """Verify and decode a JWT, memoized per token string"""
+    # Failures raise and are not cached, so only valid signatures are kept
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
+
+
 class AuthenticationDomainService:
     """Domain service for authentication business logic"""
     
@@ -33,36 +85,41 @@ class AuthenticationDomainService:
         self._session_repository = session_repository
         self._security_repository = security_repository
     
-    def generate_jwt_tokens(self, user_id: str) -> tuple[str, str]:
-        """Generate JWT access and refresh tokens"""
+    def generate_jwt_tokens(self, user_id: str) -> tuple[str, str, datetime]:
+        """Generate JWT access and refresh tokens, return them with the access expiry"""
         now = datetime.now()
+        access_expires_at = now + _ONE_HOUR
+        refresh_expires_at = now + _SEVEN_DAYS
+        # Integer epoch claims, pyjwt would otherwise convert each datetime
+        iat = int(now.timestamp())
+        access_jti, refresh_jti = _mint_jtis(2)
         
         # Generate access token
         access_payload = {
             'user_id': user_id,
             'token_type': 'access',
-            'iat': now,
-            'exp': now + timedelta(hours=1),
-            'jti': secrets.token_hex(16)
+            'iat': iat,
+            'exp': iat + int(_ONE_HOUR.total_seconds()),
+            'jti': access_jti
         }
-        access_token = jwt.encode(access_payload, settings.SECRET_KEY, algorithm='HS256')
+        access_token = _encode_jwt(access_payload)
         
         # Generate refresh token
         refresh_payload = {
             'user_id': user_id,
             'token_type': 'refresh',
-            'iat': now,
-            'exp': now + timedelta(days=7),
-            'jti': secrets.token_hex(16)
+            'iat': iat,
+            'exp': iat + int(_SEVEN_DAYS.total_seconds()),
+            'jti': refresh_jti
         }
-        refresh_token = jwt.encode(refresh_payload, settings.SECRET_KEY, algorithm='HS256')
+        refresh_token = _encode_jwt(refresh_payload)
         
         # Store tokens in repository
         access_token_entity = AuthToken(
             token=access_token,
             token_type=TokenType.ACCESS,
             user_id=user_id,
-            expires_at=now + timedelta(hours=1),
+            expires_at=access_expires_at,
             created_at=now
         )
         
@@ -70,26 +127,29 @@ class AuthenticationDomainService:
             token=refresh_token,
             token_type=TokenType.REFRESH,
             user_id=user_id,
-            expires_at=now + timedelta(days=7),
+            expires_at=refresh_expires_at,
             created_at=now
         )
         
-        self._token_repository.save_token(access_token_entity)
-        self._token_repository.save_token(refresh_token_entity)
+        self._token_repository.save_tokens([access_token_entity, refresh_token_entity])
         
-        return access_token, refresh_token
+        return access_token, refresh_token, access_expires_at
     
     def validate_jwt_token(self, token: str) -> Optional[dict]:
         """Validate JWT token and return payload"""
         try:
-            # Check if token exists in repository
+            # Verify the signature first, forged or malformed tokens are
+            # rejected without touching the token store
+            payload = _decode_jwt(token)
+            if payload.get('exp', 0) <= time.time():
+                raise jwt.ExpiredSignatureError
+            
+            # The stored token is the revocation record, logout deletes it
             token_entity = self._token_repository.find_token(token)
             if not token_entity or not token_entity.is_valid():
                 return None
             
-            # Decode JWT
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-            return payload
+            return dict(payload)
             
         except jwt.ExpiredSignatureError:
             # Mark token as revoked
@@ -98,8 +158,8 @@ class AuthenticationDomainService:
         except jwt.InvalidTokenError:
             return None
     
-    def refresh_access_token(self, refresh_token: str) -> Optional[str]:
-        """Generate new access token using refresh token"""
+    def refresh_access_token(self, refresh_token: str) -> Optional[tuple[str, datetime]]:
+        """Generate new access token using refresh token, return it with its expiry"""
         # Validate refresh token
         payload = self.validate_jwt_token(refresh_token)
         if not payload or payload.get('token_type') != 'refresh':
@@ -109,27 +169,29 @@ class AuthenticationDomainService:
         
         # Generate new access token
         now = datetime.now()
+        expires_at = now + _ONE_HOUR
+        iat = int(now.timestamp())
         access_payload = {
             'user_id': user_id,
             'token_type': 'access',
-            'iat': now,
-            'exp': now + timedelta(hours=1),
+            'iat': iat,
+            'exp': iat + int(_ONE_HOUR.total_seconds()),
             'jti': secrets.token_hex(16)
         }
-        access_token = jwt.encode(access_payload, settings.SECRET_KEY, algorithm='HS256')
+        access_token = _encode_jwt(access_payload)
         
         # Store new access token
         access_token_entity = AuthToken(
             token=access_token,
             token_type=TokenType.ACCESS,
             user_id=user_id,
-            expires_at=now + timedelta(hours=1),
+            expires_at=expires_at,
             created_at=now
         )
         
         self._token_repository.save_token(access_token_entity)
         
-        return access_token
+        return access_token, expires_at
     
     def record_login_attempt(
         self,
@@ -168,17 +230,18 @@ class AuthenticationDomainService:
         
         return saved_attempt
     
-    def is_ip_rate_limited(self, ip_address: str, max_attempts: int = 10, window_minutes: int = 15) -> bool:
-        """Check if IP address is rate limited"""
-        attempts = self._attempt_repository.find_attempts_by_ip(ip_address, window_minutes)
-        failed_attempts = [a for a in attempts if not a.success]
-        
-        return len(failed_attempts) >= max_attempts
-    
-    def is_email_rate_limited(self, email: str, max_attempts: int = 5, window_minutes: int = 15) -> bool:
-        """Check if email is rate limited"""
-        failed_count = self._attempt_repository.get_failed_attempts_count(email, window_minutes)
-        return failed_count >= max_attempts
+    def check_rate_limits(
+        self,
+        ip_address: str,
+        email: str,
+        ip_max_attempts: int = 10,
+        email_max_attempts: int = 5
+    ) -> Tuple[bool, bool]:
+        """Check IP and email rate limits together, return (ip_limited, email_limited)"""
+        ip_failed, email_failed = self._attempt_repository.get_failed_attempt_counts(
+            ip_address, email
+        )
+        return ip_failed >= ip_max_attempts, email_failed >= email_max_attempts
     
     def create_session(
         self,
@@ -188,14 +251,15 @@ class AuthenticationDomainService:
         duration_hours: int = 24
     ) -> AuthSession:
         """Create a new authentication session"""
+        now = datetime.now()
         session = AuthSession(
             session_id=secrets.token_urlsafe(32),
             user_id=user_id,
             ip_address=ip_address,
             user_agent=user_agent,
-            created_at=datetime.now(),
-            last_activity=datetime.now(),
-            expires_at=datetime.now() + timedelta(hours=duration_hours)
+            created_at=now,
+            last_activity=now,
+            expires_at=now + timedelta(hours=duration_hours)
         )
         
         return self._session_repository.save_session(session)
@@ -235,14 +299,15 @@ class AuthenticationDomainService:
     def generate_password_reset_token(self, user_id: str, email: str) -> str:
         """Generate password reset token"""
         token = secrets.token_urlsafe(32)
+        now = datetime.now()
         
         reset_request = PasswordResetRequest(
             id=None,
             user_id=user_id,
             email=email,
             token=token,
-            requested_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(hours=1)
+            requested_at=now,
+            expires_at=now + _ONE_HOUR
         )
         
         # Save request (this would be implemented in infrastructure)
@@ -0,0 +1,20 @@
+"""
+Infrastructure implementations of authentication notifications
+"""
+from django.conf import settings
+from django.template.loader import render_to_string
+
+from ..domain.notifications import AuthNotificationService
+from ...shared.infrastructure.email import send_email_async
+
+
+class EmailAuthNotificationService(AuthNotificationService):
+    """Email-based implementation of AuthNotificationService"""
+    
+    def send_password_reset(self, email: str, name: str, token: str) -> None:
+        """Send a password reset link to the user"""
+        message = render_to_string('authentication/emails/password_reset.txt', {
+            'name': name,
+            'reset_url': f"{settings.FRONTEND_URL}/reset-password?token={token}",
+        })
+        send_email_async("Reset your password", message, [email])
@@ -1,7 +1,8 @@
 """
 Infrastructure implementations of authentication repositories
 """
-from typing import Optional, List
+import time
+from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
 from django.core.cache import cache
 from django.contrib.auth import get_user_model
@@ -34,6 +35,27 @@ class CacheAuthTokenRepository(AuthTokenRepository):
         
         return token
     
+    def save_tokens(self, tokens: List[AuthToken]) -> List[AuthToken]:
+        """Save several tokens to cache, updating each user's token list once"""
+        now = datetime.now()
+        for token in tokens:
+            # Tokens expire at different times, so each needs its own timeout
+            cache.set(
+                f"auth_token:{token.token}",
+                token,
+                timeout=int((token.expires_at - now).total_seconds())
+            )
+        
+        user_tokens_keys = {f"user_tokens:{token.user_id}" for token in tokens}
+        user_tokens = cache.get_many(list(user_tokens_keys))
+        for token in tokens:
+            token_list = user_tokens.setdefault(f"user_tokens:{token.user_id}", [])
+            if token.token not in token_list:
+                token_list.append(token.token)
+        cache.set_many(user_tokens, timeout=86400 * 7)  # 7 days
+        
+        return tokens
+    
     def find_token(self, token: str) -> Optional[AuthToken]:
         """Find token in cache"""
         cache_key = f"auth_token:{token}"
@@ -65,15 +87,10 @@ class CacheAuthTokenRepository(AuthTokenRepository):
         user_tokens_key = f"user_tokens:{user_id}"
         token_list = cache.get(user_tokens_key, [])
         
-        revoked_count = 0
-        for token_str in token_list:
-            if self.revoke_token(token_str):
-                revoked_count += 1
-        
-        # Clear user tokens list
-        cache.delete(user_tokens_key)
+        # Remove every token and the user tokens list in one cache call
+        cache.delete_many([f"auth_token:{token_str}" for token_str in token_list] + [user_tokens_key])
         
-        return revoked_count
+        return len(token_list)
     
     def cleanup_expired_tokens(self) -> int:
         """Cleanup expired tokens (handled automatically by cache TTL)"""
@@ -83,25 +100,43 @@ class CacheAuthTokenRepository(AuthTokenRepository):
 class CacheLoginAttemptRepository(LoginAttemptRepository):
     """Cache-based implementation of LoginAttemptRepository"""
     
+    # Rate limits use per-window failure counters, the attempt lists are kept for auditing
+    RATE_LIMIT_WINDOW_SECONDS = 15 * 60
+    
     def save_attempt(self, attempt: LoginAttempt) -> LoginAttempt:
         """Save login attempt to cache"""
         attempt_id = f"attempt_{datetime.now().timestamp()}"
         attempt.id = attempt_id
         
-        # Store by IP
+        # Store by IP and by email, reading and writing both lists in one batch
         ip_key = f"login_attempts_ip:{attempt.ip_address}"
-        ip_attempts = cache.get(ip_key, [])
-        ip_attempts.append(attempt)
-        cache.set(ip_key, ip_attempts, timeout=3600)  # 1 hour
-        
-        # Store by email
         email_key = f"login_attempts_email:{attempt.email}"
-        email_attempts = cache.get(email_key, [])
+        cached = cache.get_many([ip_key, email_key])
+        
+        ip_attempts = cached.get(ip_key, [])
+        ip_attempts.append(attempt)
+        email_attempts = cached.get(email_key, [])
         email_attempts.append(attempt)
-        cache.set(email_key, email_attempts, timeout=3600)  # 1 hour
+        
+        cache.set_many({ip_key: ip_attempts, email_key: email_attempts}, timeout=3600)  # 1 hour
+        
+        if not attempt.success:
+            bucket = int(time.time() // self.RATE_LIMIT_WINDOW_SECONDS)
+            self._increment_counter(f"login_failures_ip:{attempt.ip_address}:{bucket}")
+            self._increment_counter(f"login_failures_email:{attempt.email}:{bucket}")
         
         return attempt
     
+    def _increment_counter(self, key: str) -> None:
+        """Atomically increment a failure counter, creating it if missing"""
+        # Two windows of lifetime so the previous bucket is still readable
+        cache.add(key, 0, timeout=self.RATE_LIMIT_WINDOW_SECONDS * 2)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Expired between add and incr
+            cache.set(key, 1, timeout=self.RATE_LIMIT_WINDOW_SECONDS * 2)
+    
     def find_recent_attempts(self, email: str, minutes: int = 15) -> List[LoginAttempt]:
         """Find recent login attempts for an email"""
         return self.find_attempts_by_email(email, minutes)
@@ -122,10 +157,30 @@ class CacheLoginAttemptRepository(LoginAttemptRepository):
         cutoff_time = datetime.now() - timedelta(minutes=window_minutes)
         return [a for a in attempts if a.attempted_at >= cutoff_time]
     
-    def get_failed_attempts_count(self, email: str, window_minutes: int) -> int:
-        """Get count of failed attempts for email"""
-        attempts = self.find_attempts_by_email(email, window_minutes)
-        return len([a for a in attempts if not a.success])
+    def get_failed_attempt_counts(self, ip_address: str, email: str) -> Tuple[int, int]:
+        """Get counts of recent failed attempts for an IP and an email in one lookup"""
+        # Sliding window estimate: the current bucket plus the part of the
+        # previous bucket that still overlaps the window
+        now = time.time()
+        bucket = int(now // self.RATE_LIMIT_WINDOW_SECONDS)
+        previous_weight = 1 - (now % self.RATE_LIMIT_WINDOW_SECONDS) / self.RATE_LIMIT_WINDOW_SECONDS
+        
+        ip_key = f"login_failures_ip:{ip_address}"
+        email_key = f"login_failures_email:{email}"
+        counters = cache.get_many([
+            f"{ip_key}:{bucket}", f"{ip_key}:{bucket - 1}",
+            f"{email_key}:{bucket}", f"{email_key}:{bucket - 1}",
+        ])
+        
+        ip_current = counters.get(f"{ip_key}:{bucket}", 0)
+        ip_previous = counters.get(f"{ip_key}:{bucket - 1}", 0)
+        email_current = counters.get(f"{email_key}:{bucket}", 0)
+        email_previous = counters.get(f"{email_key}:{bucket - 1}", 0)
+        
+        return (
+            int(ip_current + ip_previous * previous_weight),
+            int(email_current + email_previous * previous_weight)
+        )
 
 
 class CacheAuthSessionRepository(AuthSessionRepository):
@@ -156,13 +211,9 @@ class CacheAuthSessionRepository(AuthSessionRepository):
         user_sessions_key = f"user_sessions:{user_id}"
         session_ids = cache.get(user_sessions_key, [])
         
-        sessions = []
-        for session_id in session_ids:
-            session = self.find_session(session_id)
-            if session and session.is_valid():
-                sessions.append(session)
-        
-        return sessions
+        # One batched fetch instead of a cache round trip per session
+        cached_sessions = cache.get_many([f"auth_session:{session_id}" for session_id in session_ids])
+        return [session for session in cached_sessions.values() if session.is_valid()]
     
     def terminate_session(self, session_id: str) -> bool:
         """Terminate a specific session"""
@@ -175,15 +226,24 @@ class CacheAuthSessionRepository(AuthSessionRepository):
     
     def terminate_all_user_sessions(self, user_id: str) -> int:
         """Terminate all sessions for a user"""
-        sessions = self.find_user_sessions(user_id)
-        for session in sessions:
-            self.terminate_session(session.session_id)
+        user_sessions_key = f"user_sessions:{user_id}"
+        session_ids = cache.get(user_sessions_key, [])
+        
+        # Fetch and rewrite all sessions in batch instead of a get/set pair each
+        cached_sessions = cache.get_many([f"auth_session:{session_id}" for session_id in session_ids])
+        terminated = {}
+        for cache_key, session in cached_sessions.items():
+            if session.is_valid():
+                session.is_active = False
+                terminated[cache_key] = session
+        
+        if terminated:
+            cache.set_many(terminated, timeout=60)  # Keep for a minute for cleanup
         
         # Clear user sessions list
-        user_sessions_key = f"user_sessions:{user_id}"
         cache.delete(user_sessions_key)
         
-        return len(sessions)
+        return len(terminated)
     
     def cleanup_expired_sessions(self) -> int:
         """Cleanup expired sessions (handled automatically by cache TTL)"""
@@ -235,8 +295,7 @@ class CacheSecurityEventRepository(SecurityEventRepository):
         event.id = event_id
         
         # Store individual event
-        cache_key = f"security_event:{event_id}"
-        cache.set(cache_key, event, timeout=86400 * 30)  # 30 days
+        entries = {f"security_event:{event_id}": event}
         
         # Add to user events list
         if event.user_id:
@@ -246,23 +305,23 @@ class CacheSecurityEventRepository(SecurityEventRepository):
             # Keep only last 100 events
             if len(user_events) > 100:
                 user_events = user_events[-100:]
-            cache.set(user_events_key, user_events, timeout=86400 * 30)
+            entries[user_events_key] = user_events
+        
+        # Event and user list share a timeout, write them in one cache call
+        cache.set_many(entries, timeout=86400 * 30)  # 30 days
         
         return event
     
     def find_user_events(self, user_id: str, limit: int = 50) -> List[SecurityEvent]:
         """Find security events for a user"""
         user_events_key = f"user_security_events:{user_id}"
-        event_ids = cache.get(user_events_key, [])
-        
-        events = []
-        for event_id in event_ids[-limit:]:  # Get last N events
-            cache_key = f"security_event:{event_id}"
-            event = cache.get(cache_key)
-            if event:
-                events.append(event)
+        event_ids = cache.get(user_events_key, []) if limit > 0 else []
         
-        return sorted(events, key=lambda e: e.occurred_at, reverse=True)
+        # Ids are appended as events happen, so the tail reversed is the
+        # newest-first top N; fetch it in one batch instead of sorting
+        cache_keys = [f"security_event:{event_id}" for event_id in event_ids[-limit:]]
+        cached_events = cache.get_many(cache_keys)
+        return [cached_events[key] for key in reversed(cache_keys) if key in cached_events]
     
     def find_critical_events(self, hours: int = 24) -> List[SecurityEvent]:
         """Find critical security events in time window"""
@@ -64,13 +64,6 @@ class RegisterSerializer(serializers.Serializer):
         except ValidationError as e:
             raise serializers.ValidationError(e.messages)
         return value
-    
-    def validate_email(self, value):
-        """Validate email uniqueness"""
-        from ...users.infrastructure.models import UserModel
-        if UserModel.objects.filter(email=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
 
 
 class RegisterResponseSerializer(serializers.Serializer):
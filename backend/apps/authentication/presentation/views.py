@@ -28,21 +28,31 @@ from ..application.dto import (
     ValidateTokenRequestDTO, PasswordResetRequestDTO,
     ResetPasswordRequestDTO
 )
-from ...users.application.use_cases import CreateUserUseCase, GetUserUseCase
+from ...users.application.use_cases import CreateUserUseCase
 from ...users.application.dto import CreateUserDTO
+from ...users.domain.repositories import EmailAlreadyRegisteredError
 from ...shared.infrastructure.dependency_injection import get_dependency
 
 
 User = get_user_model()
 
 
+_MISSING = object()
+
+
 def get_client_ip(request):
-    """Get client IP address from request"""
+    """Get client IP address from request, parsed once per request"""
+    cached = getattr(request, '_cached_client_ip', _MISSING)
+    if cached is not _MISSING:
+        return cached
+    
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
     if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
+        # Only the first hop is needed, partition avoids building a list
+        ip = x_forwarded_for.partition(',')[0].strip()
     else:
         ip = request.META.get('REMOTE_ADDR')
+    request._cached_client_ip = ip
     return ip
 
 
@@ -80,6 +90,12 @@ def register(request):
             
             return Response(response_data, status=status.HTTP_201_CREATED)
             
+        except EmailAlreadyRegisteredError:
+            # Uniqueness is enforced on insert; report it like a field error
+            return Response(
+                {'email': ["A user with this email already exists."]},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except ValueError as e:
             return Response(
                 {'error': str(e)},
@@ -122,10 +138,7 @@ def login(request):
             result = login_use_case.execute(dto)
             
             if result.success:
-                # Get user information
-                user_use_case = get_dependency(GetUserUseCase)
-                user_dto = user_use_case.execute(result.user_id)
-                
+                # The login result already carries the authenticated user
                 response_data = {
                     'access_token': result.access_token,
                     'refresh_token': result.refresh_token,
@@ -134,10 +147,10 @@ def login(request):
                     'user_id': result.user_id,
                     'expires_at': result.expires_at,
                     'user': {
-                        'id': user_dto.id,
-                        'name': user_dto.name,
-                        'email': user_dto.email
-                    } if user_dto else None
+                        'id': result.user_id,
+                        'name': result.user_name,
+                        'email': result.user_email
+                    }
                 }
                 return Response(response_data, status=status.HTTP_200_OK)
             else:
@@ -414,7 +427,8 @@ def get_security_events(request):
         events_use_case = get_dependency(GetSecurityEventsUseCase)
         events = events_use_case.execute(
             user_id=str(request.user.id),
-            limit=int(request.GET.get('limit', 50))
+            # Only the last 100 events per user are kept
+            limit=min(max(int(request.GET.get('limit', 50)), 1), 100)
         )
         
         serializer = SecurityEventSerializer(events, many=True)
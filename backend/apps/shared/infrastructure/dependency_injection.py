@@ -1,64 +1,57 @@
 """
 Dependency Injection Container for Clean Architecture
 """
+from functools import wraps
 from typing import Dict, Any, Callable, TypeVar, Type
 from abc import ABC, abstractmethod
 
 T = TypeVar('T')
 
+_UNRESOLVED = object()
+
 
 class DIContainer:
     """Simple Dependency Injection Container"""
     
     def __init__(self):
-        self._services: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable] = {}
-        self._singletons: Dict[str, Any] = {}
+        # One resolver per interface class, so get() is a single lookup and call
+        self._resolvers: Dict[type, Callable[[], Any]] = {}
     
     def register_singleton(self, interface: Type[T], implementation: Type[T]) -> None:
         """Register a singleton service"""
-        key = self._get_key(interface)
-        self._factories[key] = lambda: implementation()
-        self._singletons[key] = None
+        self._resolvers[interface] = self._singleton_resolver(interface, implementation)
     
     def register_transient(self, interface: Type[T], implementation: Type[T]) -> None:
         """Register a transient service (new instance each time)"""
-        key = self._get_key(interface)
-        self._factories[key] = lambda: implementation()
+        self._resolvers[interface] = lambda: implementation()
     
     def register_instance(self, interface: Type[T], instance: T) -> None:
         """Register a specific instance"""
-        key = self._get_key(interface)
-        self._services[key] = instance
+        self._resolvers[interface] = lambda: instance
     
     def register_factory(self, interface: Type[T], factory: Callable[[], T]) -> None:
         """Register a factory function"""
-        key = self._get_key(interface)
-        self._factories[key] = factory
+        self._resolvers[interface] = factory
+    
+    def register_singleton_factory(self, interface: Type[T], factory: Callable[[], T]) -> None:
+        """Register a factory function whose first result is reused"""
+        self._resolvers[interface] = self._singleton_resolver(interface, factory)
     
     def get(self, interface: Type[T]) -> T:
         """Get service instance"""
-        key = self._get_key(interface)
-        
-        # Check if we have a direct instance
-        if key in self._services:
-            return self._services[key]
-        
-        # Check if it's a singleton
-        if key in self._singletons:
-            if self._singletons[key] is None:
-                self._singletons[key] = self._factories[key]()
-            return self._singletons[key]
-        
-        # Create new instance
-        if key in self._factories:
-            return self._factories[key]()
-        
-        raise ValueError(f"Service {interface.__name__} not registered")
-    
-    def _get_key(self, interface: Type) -> str:
-        """Get string key for interface"""
-        return f"{interface.__module__}.{interface.__name__}"
+        try:
+            resolver = self._resolvers[interface]
+        except KeyError:
+            raise ValueError(f"Service {interface.__name__} not registered") from None
+        return resolver()
+    
+    def _singleton_resolver(self, interface: Type[T], factory: Callable[[], T]) -> Callable[[], T]:
+        """Build a resolver that creates the service once, then replaces itself"""
+        def resolve() -> T:
+            instance = factory()
+            self._resolvers[interface] = lambda: instance
+            return instance
+        return resolve
 
 
 # Global container instance
@@ -95,6 +88,8 @@ def configure_dependencies():
         CachePasswordResetRepository, CacheSecurityEventRepository
     )
     from apps.authentication.domain.services import AuthenticationDomainService
+    from apps.authentication.domain.notifications import AuthNotificationService
+    from apps.authentication.infrastructure.notifications import EmailAuthNotificationService
     from apps.authentication.application.use_cases import (
         LoginUseCase, RefreshTokenUseCase, LogoutUseCase, ValidateTokenUseCase,
         PasswordResetRequestUseCase, ResetPasswordUseCase, GetUserSessionsUseCase,
@@ -113,6 +108,7 @@ def configure_dependencies():
     container.register_singleton(AuthSessionRepository, CacheAuthSessionRepository)
     container.register_singleton(PasswordResetRepository, CachePasswordResetRepository)
     container.register_singleton(SecurityEventRepository, CacheSecurityEventRepository)
+    container.register_singleton(AuthNotificationService, EmailAuthNotificationService)
     
     # Register Task domain services
     container.register_factory(
@@ -126,8 +122,9 @@ def configure_dependencies():
         lambda: UserDomainService(container.get(UserRepository))
     )
     
-    # Register Authentication domain services
-    container.register_factory(
+    # Register Authentication domain services, stateless on top of the
+    # singleton repositories so one instance is shared
+    container.register_singleton_factory(
         AuthenticationDomainService,
         lambda: AuthenticationDomainService(
             container.get(AuthTokenRepository),
@@ -203,8 +200,9 @@ def configure_dependencies():
         )
     )
     
-    # Register Authentication use cases
-    container.register_factory(
+    # Register Authentication use cases, they only hold singletons and
+    # stateless services so each is built once
+    container.register_singleton_factory(
         LoginUseCase,
         lambda: LoginUseCase(
             container.get(UserRepository),
@@ -213,30 +211,31 @@ def configure_dependencies():
         )
     )
     
-    container.register_factory(
+    container.register_singleton_factory(
         RefreshTokenUseCase,
         lambda: RefreshTokenUseCase(container.get(AuthenticationDomainService))
     )
     
-    container.register_factory(
+    container.register_singleton_factory(
         LogoutUseCase,
         lambda: LogoutUseCase(container.get(AuthenticationDomainService))
     )
     
-    container.register_factory(
+    container.register_singleton_factory(
         ValidateTokenUseCase,
         lambda: ValidateTokenUseCase(container.get(AuthenticationDomainService))
     )
     
-    container.register_factory(
+    container.register_singleton_factory(
         PasswordResetRequestUseCase,
         lambda: PasswordResetRequestUseCase(
             container.get(UserRepository),
-            container.get(AuthenticationDomainService)
+            container.get(AuthenticationDomainService),
+            container.get(AuthNotificationService)
         )
     )
     
-    container.register_factory(
+    container.register_singleton_factory(
         ResetPasswordUseCase,
         lambda: ResetPasswordUseCase(
             container.get(UserRepository),
@@ -244,25 +243,39 @@ def configure_dependencies():
         )
     )
     
-    container.register_factory(
+    container.register_singleton_factory(
         GetUserSessionsUseCase,
         lambda: GetUserSessionsUseCase(container.get(AuthSessionRepository))
     )
     
-    container.register_factory(
+    container.register_singleton_factory(
         GetSecurityEventsUseCase,
         lambda: GetSecurityEventsUseCase(container.get(SecurityEventRepository))
     )
 
 
 # Decorator for dependency injection
-def inject(interface: Type[T]) -> Callable:
-    """Decorator to inject dependencies"""
+def inject(interface: Type[T], cache: bool = False) -> Callable:
+    """Decorator to inject dependencies, cache=True resolves them only once"""
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            service = container.get(interface)
+        if not cache:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(container.get(interface), *args, **kwargs)
+            return wrapper
+        
+        service = _UNRESOLVED
+        
+        @wraps(func)
+        def cached_wrapper(*args, **kwargs):
+            nonlocal service
+            # Resolved on first call, the container is configured by then.
+            # Only opt in for services that are safe to share for the life of
+            # the process, transients would otherwise stop being transient
+            if service is _UNRESOLVED:
+                service = container.get(interface)
             return func(service, *args, **kwargs)
-        return wrapper
+        return cached_wrapper
     return decorator
 
 
@@ -0,0 +1,37 @@
+"""
+Email delivery helpers shared across apps
+"""
+import logging
+import threading
+from typing import List
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
+def _deliver(subject: str, message: str, recipient_list: List[str]) -> None:
+    """Send an email, logging instead of raising on failure"""
+    try:
+        send_mail(subject, message, settings.DEFAULT_FROM_EMAIL, recipient_list)
+    except Exception as e:
+        logger.error("Failed to send email '%s' to %s: %s", subject, recipient_list, e)
+
+
+def send_email_async(subject: str, message: str, recipient_list: List[str]) -> None:
+    """
+    Send an email outside of the request cycle.
+    
+    Delivery starts once the current transaction commits, on a daemon
+    thread, so SMTP latency never blocks the HTTP response.
+    """
+    def start():
+        threading.Thread(
+            target=_deliver,
+            args=(subject, message, recipient_list),
+            daemon=True
+        ).start()
+    
+    transaction.on_commit(start)
@@ -0,0 +1,39 @@
+"""
+Paginators shared across apps
+"""
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses the PostgreSQL planner estimate for unfiltered counts.
+    
+    An exact COUNT(*) scans the whole table, so when the queryset has no
+    filters and the table is large the row estimate from pg_class is used
+    instead. Filtered querysets and small tables still get an exact count.
+    """
+    
+    # Below this many rows the estimate is not worth its inaccuracy
+    ESTIMATE_THRESHOLD = 10000
+    
+    @cached_property
+    def count(self):
+        """Return the total number of objects, estimated when unfiltered"""
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        
+        if query is not None and not query.where:
+            connection = connections[queryset.db]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples::BIGINT FROM pg_class WHERE relname = %s",
+                        [queryset.model._meta.db_table]
+                    )
+                    row = cursor.fetchone()
+                if row and row[0] >= self.ESTIMATE_THRESHOLD:
+                    return row[0]
+        
+        return super().count
@@ -0,0 +1,26 @@
+"""
+Cache keys and invalidation for the statistics endpoints
+"""
+from django.core.cache import cache
+
+
+# Statistics aggregate over whole tables, dashboards can live with brief staleness
+STATISTICS_CACHE_TIMEOUT = 30
+
+USER_STATISTICS_KEY = 'user_statistics'
+
+
+def task_statistics_key(user_id) -> str:
+    """Cache key for a user's task statistics"""
+    return f"task_statistics:{user_id}"
+
+
+def invalidate_task_statistics(user_id) -> None:
+    """Drop cached statistics affected by a change to the user's tasks"""
+    # users_with_tasks in the user statistics depends on tasks as well
+    cache.delete_many([task_statistics_key(user_id), USER_STATISTICS_KEY])
+
+
+def invalidate_user_statistics() -> None:
+    """Drop cached user statistics after a change to users"""
+    cache.delete(USER_STATISTICS_KEY)
@@ -0,0 +1,23 @@
+"""
+Conditional GET helpers for list endpoints
+"""
+import hashlib
+from datetime import datetime
+from typing import Optional, Tuple
+
+from django.utils import timezone
+
+
+def list_etag(request, version: Tuple[int, Optional[datetime]]) -> str:
+    """Build a weak ETag for a list from the caller, its filters and the list version"""
+    count, last_updated = version
+    # Some list fields are derived from the clock (overdue, locked), so the
+    # tag rolls over every minute even when no row changed
+    minute = timezone.now().strftime('%Y%m%d%H%M')
+    raw = f"{request.user.id}|{request.path}|{request.query_params.urlencode()}|{count}|{last_updated}|{minute}"
+    return f'W/"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+
+def is_not_modified(request, etag: str) -> bool:
+    """Check whether the client already holds the list tagged with etag"""
+    return etag in request.headers.get('If-None-Match', '')
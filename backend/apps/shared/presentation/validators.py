@@ -0,0 +1,19 @@
+"""
+Shared field validators for DRF serializers
+"""
+from typing import Optional
+from rest_framework import serializers
+
+
+def clean_text(value: Optional[str], field: str, min_length: int = 1) -> Optional[str]:
+    """Strip a text value once and check it is not empty and long enough"""
+    if value is None:
+        return value
+    
+    stripped = value.strip()
+    if not stripped:
+        raise serializers.ValidationError(f"{field} cannot be empty")
+    if len(stripped) < min_length:
+        raise serializers.ValidationError(f"{field} must be at least {min_length} characters long")
+    
+    return stripped
@@ -0,0 +1,148 @@
+"""
+Django admin configuration for Task infrastructure layer
+"""
+from django.contrib import admin, messages
+from django.db import transaction
+from django.db.models import BooleanField, Case, OuterRef, Q, Subquery, Value, When
+from django.utils import timezone
+from django.utils.html import format_html
+
+from apps.shared.infrastructure.pagination import EstimatedCountPaginator
+from apps.shared.infrastructure.statistics_cache import invalidate_task_statistics
+from apps.users.infrastructure.models import UserModel
+from .infrastructure.models import TaskModel, PRIORITY_RANK
+from .infrastructure.signals import tasks_bulk_completed, tasks_bulk_reopened
+
+
+_BADGE_HTML = '<span style="color: {}; font-weight: bold;">{}</span>'
+
+_PRIORITY_COLORS = {
+    TaskModel.Priority.LOW: '#28a745',
+    TaskModel.Priority.MEDIUM: '#ffc107',
+    TaskModel.Priority.HIGH: '#fd7e14',
+    TaskModel.Priority.URGENT: '#dc3545',
+}
+
+# Badges are fixed per choice, so render them once at import time
+_PRIORITY_BADGES = {
+    value: format_html(_BADGE_HTML, color, TaskModel.PRIORITY_LABELS[value])
+    for value, color in _PRIORITY_COLORS.items()
+}
+_STATUS_BADGES = {
+    TaskModel.Status.COMPLETED: format_html(_BADGE_HTML, '#28a745', '✓ Completed'),
+    TaskModel.Status.PENDING: format_html(_BADGE_HTML, '#6c757d', '○ Pending'),
+    TaskModel.Status.IN_PROGRESS: format_html(_BADGE_HTML, '#007bff', '◐ In Progress'),
+    TaskModel.Status.CANCELLED: format_html(_BADGE_HTML, '#adb5bd', '✗ Cancelled'),
+}
+_OVERDUE_BADGE = format_html(_BADGE_HTML, '#dc3545', 'Overdue')
+_ON_TIME_BADGE = format_html(_BADGE_HTML, '#28a745', 'On time')
+
+
+@admin.register(TaskModel)
+class TaskAdmin(admin.ModelAdmin):
+    """Admin for Task persistence"""
+    
+    list_display = [
+        'title', 'priority_badge', 'status_badge', 'due_date',
+        'is_overdue_badge', 'user_name', 'created_at'
+    ]
+    list_filter = ['status', 'priority', 'due_date', 'created_at']
+    search_fields = ['title', 'description']
+    readonly_fields = ['id', 'completed_at', 'created_at', 'updated_at']
+    ordering = ['-created_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ['mark_completed', 'mark_pending']
+    # TaskModel references users by a plain user_id column, so there is no
+    # relation for list_select_related to follow; the owner name is joined
+    # in get_queryset instead.
+    list_select_related = False
+    
+    def get_queryset(self, request):
+        """Fetch owner name, overdue flag and priority rank alongside each task in the same query"""
+        owner_name = UserModel.objects.filter(pk=OuterRef('user_id')).values('name')[:1]
+        is_overdue = Case(
+            When(
+                Q(due_date__lt=timezone.now()) & ~Q(status=TaskModel.Status.COMPLETED),
+                then=Value(True),
+            ),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+        return super().get_queryset(request).annotate(
+            user_name=Subquery(owner_name),
+            is_overdue_annot=is_overdue,
+            priority_rank=PRIORITY_RANK,
+        )
+    
+    @admin.display(description='User', ordering='user_name')
+    def user_name(self, obj):
+        """Display the task owner's name"""
+        return obj.user_name
+    
+    @admin.display(description='Priority', ordering='priority_rank')
+    def priority_badge(self, obj):
+        """Display a color-coded priority"""
+        return _PRIORITY_BADGES.get(obj.priority, obj.priority)
+    
+    @admin.display(description='Status', ordering='status')
+    def status_badge(self, obj):
+        """Display a color-coded status"""
+        return _STATUS_BADGES.get(obj.status, obj.status)
+    
+    @admin.display(description='Overdue', ordering='is_overdue_annot')
+    def is_overdue_badge(self, obj):
+        """Display whether the task is past its due date"""
+        return _OVERDUE_BADGE if obj.is_overdue_annot else _ON_TIME_BADGE
+    
+    def _bulk_set_status(self, queryset, from_statuses, to_status, completed_at):
+        """Move the selected tasks to a new status in one locked UPDATE"""
+        with transaction.atomic():
+            # Lock the rows so completed_at cannot race a concurrent update
+            rows = list(
+                TaskModel.objects
+                .filter(pk__in=queryset.values('pk'), status__in=from_statuses)
+                .select_for_update()
+                .values_list('id', 'user_id')
+            )
+            task_ids = [task_id for task_id, _ in rows]
+            updated = TaskModel.objects.filter(id__in=task_ids).update(
+                status=to_status,
+                completed_at=completed_at,
+                updated_at=timezone.now(),
+            )
+            
+            # Drop cached statistics once the new statuses are visible
+            user_ids = {user_id for _, user_id in rows}
+            transaction.on_commit(lambda: self._invalidate_statistics(user_ids))
+        return task_ids, updated
+    
+    @staticmethod
+    def _invalidate_statistics(user_ids):
+        """Invalidate the cached task statistics of every affected user"""
+        for user_id in user_ids:
+            invalidate_task_statistics(user_id)
+    
+    @admin.action(description='Mark selected tasks as completed')
+    def mark_completed(self, request, queryset):
+        """Complete the selected open tasks"""
+        task_ids, updated = self._bulk_set_status(
+            queryset,
+            [TaskModel.Status.PENDING, TaskModel.Status.IN_PROGRESS],
+            TaskModel.Status.COMPLETED,
+            timezone.now(),
+        )
+        tasks_bulk_completed.send(sender=TaskModel, task_ids=task_ids)
+        self.message_user(request, f"{updated} task(s) marked as completed.", messages.SUCCESS)
+    
+    @admin.action(description='Mark selected tasks as pending')
+    def mark_pending(self, request, queryset):
+        """Reopen the selected completed tasks"""
+        task_ids, updated = self._bulk_set_status(
+            queryset,
+            [TaskModel.Status.COMPLETED],
+            TaskModel.Status.PENDING,
+            None,
+        )
+        tasks_bulk_reopened.send(sender=TaskModel, task_ids=task_ids)
+        self.message_user(request, f"{updated} task(s) marked as pending.", messages.SUCCESS)
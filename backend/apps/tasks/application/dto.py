@@ -2,12 +2,28 @@
 Data Transfer Objects for Task application layer
 """
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from ..domain.entities import Task, TaskPriority, TaskStatus
 
 
-@dataclass
+# Lookup tables for the string to enum conversions, built once
+_PRIORITY_MAP = {
+    'low': TaskPriority.LOW,
+    'medium': TaskPriority.MEDIUM,
+    'high': TaskPriority.HIGH,
+    'urgent': TaskPriority.URGENT
+}
+
+_STATUS_MAP = {
+    'pending': TaskStatus.PENDING,
+    'in_progress': TaskStatus.IN_PROGRESS,
+    'completed': TaskStatus.COMPLETED,
+    'cancelled': TaskStatus.CANCELLED
+}
+
+
+@dataclass(slots=True)
 class CreateTaskDTO:
     """DTO for task creation"""
     title: str
@@ -18,16 +34,10 @@ class CreateTaskDTO:
     
     def to_priority_enum(self) -> TaskPriority:
         """Convert string priority to enum"""
-        priority_map = {
-            'low': TaskPriority.LOW,
-            'medium': TaskPriority.MEDIUM,
-            'high': TaskPriority.HIGH,
-            'urgent': TaskPriority.URGENT
-        }
-        return priority_map.get(self.priority.lower(), TaskPriority.MEDIUM)
+        return _PRIORITY_MAP.get(self.priority.lower(), TaskPriority.MEDIUM)
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateTaskDTO:
     """DTO for task updates"""
     task_id: str
@@ -42,29 +52,17 @@ class UpdateTaskDTO:
         if not self.priority:
             return None
         
-        priority_map = {
-            'low': TaskPriority.LOW,
-            'medium': TaskPriority.MEDIUM,
-            'high': TaskPriority.HIGH,
-            'urgent': TaskPriority.URGENT
-        }
-        return priority_map.get(self.priority.lower())
+        return _PRIORITY_MAP.get(self.priority.lower())
     
     def to_status_enum(self) -> Optional[TaskStatus]:
         """Convert string status to enum"""
         if not self.status:
             return None
         
-        status_map = {
-            'pending': TaskStatus.PENDING,
-            'in_progress': TaskStatus.IN_PROGRESS,
-            'completed': TaskStatus.COMPLETED,
-            'cancelled': TaskStatus.CANCELLED
-        }
-        return status_map.get(self.status.lower())
+        return _STATUS_MAP.get(self.status.lower())
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDTO:
     """DTO for task representation"""
     id: str
@@ -81,8 +79,9 @@ class TaskDTO:
     days_until_due: Optional[int]
     
     @classmethod
-    def from_entity(cls, task: Task) -> 'TaskDTO':
-        """Create DTO from domain entity"""
+    def from_entity(cls, task: Task, now: Optional[datetime] = None) -> 'TaskDTO':
+        """Create DTO from domain entity, now can be shared across a list"""
+        now = now or datetime.now(timezone.utc)
         return cls(
             id=task.id,
             title=task.title,
@@ -94,12 +93,12 @@ class TaskDTO:
             user_id=task.user_id,
             created_at=task.created_at,
             updated_at=task.updated_at,
-            is_overdue=task.is_overdue(),
-            days_until_due=task.days_until_due()
+            is_overdue=task.is_overdue(now),
+            days_until_due=task.days_until_due(now)
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskFilterDTO:
     """DTO for task filtering"""
     user_id: Optional[str] = None
@@ -111,14 +110,14 @@ class TaskFilterDTO:
     search_term: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BulkCompleteTasksDTO:
     """DTO for bulk task completion"""
     task_ids: list[str]
     user_id: str  # For authorization
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskStatisticsDTO:
     """DTO for task statistics"""
     total_tasks: int
@@ -141,7 +140,7 @@ class TaskStatisticsDTO:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductivityDTO:
     """DTO for user productivity metrics"""
     total_tasks: int
@@ -151,7 +150,7 @@ class ProductivityDTO:
     productivity_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskSuggestionDTO:
     """DTO for task suggestions"""
     reason: str
@@ -1,8 +1,8 @@
 """
 Task use cases - Application layer orchestrating business logic
 """
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Tuple
+from datetime import datetime, timezone
 
 from ..domain.entities import Task, TaskPriority, TaskStatus, TaskFilter
 from ..domain.repositories import TaskRepository
@@ -37,8 +37,8 @@ class CreateTaskUseCase:
             updated_at=datetime.now()
         )
         
-        # Validate business rules
-        existing_tasks = self._task_repository.find_by_user_id(dto.user_id)
+        # Validate business rules (only incomplete tasks take part in them)
+        existing_tasks = self._task_repository.find_incomplete_by_user_id(dto.user_id)
         validation_errors = self._validation_service.validate_task_creation(task, existing_tasks)
         
         if validation_errors:
@@ -62,14 +62,14 @@ class UpdateTaskUseCase:
         import logging
         logger = logging.getLogger(__name__)
         
-        logger.info(f"UpdateTaskUseCase - DTO: {dto}")
+        logger.info("UpdateTaskUseCase - DTO: %s", dto)
         
         # Find existing task
         existing_task = self._task_repository.find_by_id(dto.task_id)
         if not existing_task:
             raise ValueError(f"Task with ID {dto.task_id} not found")
         
-        logger.info(f"UpdateTaskUseCase - Found existing task: {existing_task.title}")
+        logger.info("UpdateTaskUseCase - Found existing task: %s", existing_task.title)
         
         # Create updated task (don't set status yet if it's changing)
         updated_task = Task(
@@ -85,7 +85,7 @@ class UpdateTaskUseCase:
             updated_at=datetime.now()
         )
         
-        logger.info(f"UpdateTaskUseCase - Status change: {dto.status}, existing: {existing_task.status}")
+        logger.info("UpdateTaskUseCase - Status change: %s, existing: %s", dto.status, existing_task.status)
         
         # Handle status changes
         if dto.status == 'completed' and existing_task.status != TaskStatus.COMPLETED:
@@ -97,17 +97,17 @@ class UpdateTaskUseCase:
         elif dto.status is not None and dto.status != existing_task.status.value:
             # For other status changes, set directly
             updated_task.status = dto.to_status_enum()
-            logger.info(f"UpdateTaskUseCase - Status changed to: {dto.status}")
+            logger.info("UpdateTaskUseCase - Status changed to: %s", dto.status)
         
         # Validate business rules
         validation_errors = self._validation_service.validate_task_update(existing_task, updated_task)
         if validation_errors:
-            logger.error(f"UpdateTaskUseCase - Validation errors: {validation_errors}")
+            logger.error("UpdateTaskUseCase - Validation errors: %s", validation_errors)
             raise ValueError(f"Validation failed: {', '.join(validation_errors)}")
         
         # Save updated task
         saved_task = self._task_repository.save(updated_task)
-        logger.info(f"UpdateTaskUseCase - Task saved successfully")
+        logger.info("UpdateTaskUseCase - Task saved successfully")
         
         return TaskDTO.from_entity(saved_task)
 
@@ -140,8 +140,20 @@ class ListTasksUseCase:
     
     def execute(self, dto: TaskFilterDTO) -> List[TaskDTO]:
         """Execute task listing with filters"""
-        # Convert DTO to domain filter
-        domain_filter = TaskFilter(
+        # Get filtered tasks
+        tasks = self._task_repository.find_with_filter(self._to_domain_filter(dto))
+        
+        # Convert to DTOs against a single clock reading
+        now = datetime.now(timezone.utc)
+        return [TaskDTO.from_entity(task, now) for task in tasks]
+    
+    def get_version(self, dto: TaskFilterDTO) -> Tuple[int, Optional[datetime]]:
+        """Get the count and latest update time of the listed tasks"""
+        return self._task_repository.get_filter_version(self._to_domain_filter(dto))
+    
+    def _to_domain_filter(self, dto: TaskFilterDTO) -> TaskFilter:
+        """Convert DTO to domain filter"""
+        return TaskFilter(
             user_id=dto.user_id,
             status=TaskStatus(dto.status) if dto.status else None,
             priority=TaskPriority(dto.priority) if dto.priority else None,
@@ -150,12 +162,6 @@ class ListTasksUseCase:
             due_date_to=dto.due_date_to,
             search_term=dto.search_term
         )
-        
-        # Get filtered tasks
-        tasks = self._task_repository.find_with_filter(domain_filter)
-        
-        # Convert to DTOs
-        return [TaskDTO.from_entity(task) for task in tasks]
 
 
 class DeleteTaskUseCase:
@@ -191,26 +197,38 @@ class BulkCompleteTasksUseCase:
         if not dto.task_ids:
             raise ValueError("No task IDs provided")
         
-        # Verify all tasks belong to the user
-        updated_count = 0
-        auto_completed_tasks = []
+        # Load the user's open tasks once and replay the per-task rules in
+        # memory: ids that are missing, foreign or already completed (also by
+        # an earlier auto-completion) are skipped, as with one query per task
+        open_tasks = {
+            task.id: task for task in self._task_repository.find_incomplete_by_user_id(dto.user_id)
+        }
         
+        updated_ids = []
+        auto_completed_ids = []
         for task_id in dto.task_ids:
-            task = self._task_repository.find_by_id(task_id)
-            
+            task = open_tasks.pop(task_id, None)
             if not task:
-                continue  # Skip non-existent tasks
+                continue
             
-            if task.user_id != dto.user_id:
-                continue  # Skip tasks that don't belong to user
+            task.mark_as_completed()
+            updated_ids.append(task_id)
             
-            if not task.is_completed:
-                task.mark_as_completed()
-                saved_task = self._task_repository.save(task)
-                updated_count += 1
-                
-                related_tasks = self._domain_service.auto_complete_related_tasks(saved_task)
-                auto_completed_tasks.extend(related_tasks)
+            for related in self._domain_service.find_related_tasks(task, list(open_tasks.values())):
+                del open_tasks[related.id]
+                auto_completed_ids.append(related.id)
+        
+        # Persist requested and related completions in one UPDATE
+        saved_tasks = {
+            task.id: task
+            for task in self._task_repository.complete_user_tasks(
+                updated_ids + auto_completed_ids, dto.user_id
+            )
+        }
+        updated_count = sum(1 for task_id in updated_ids if task_id in saved_tasks)
+        auto_completed_tasks = [
+            saved_tasks[task_id] for task_id in auto_completed_ids if task_id in saved_tasks
+        ]
         
         return {
             'updated_count': updated_count,
@@ -285,10 +303,8 @@ class AutoPrioritizeTasksUseCase:
     
     def execute(self, user_id: str) -> List[TaskDTO]:
         """Execute automatic task prioritization"""
-        user_tasks = self._task_repository.find_by_user_id(user_id)
-        
-        # Filter only pending tasks
-        pending_tasks = [task for task in user_tasks if not task.is_completed]
+        # Filter only pending tasks in the database
+        pending_tasks = self._task_repository.find_incomplete_by_user_id(user_id)
         
         updated_tasks = self._domain_service.prioritize_tasks_by_deadline(pending_tasks)
         
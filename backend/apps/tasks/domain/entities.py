@@ -2,7 +2,7 @@
 Task domain entities - Pure business logic without framework dependencies
 """
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from enum import Enum
 
@@ -23,7 +23,7 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Task domain entity with business logic"""
     id: Optional[str]
@@ -46,9 +46,9 @@ class Task:
         if not self.title or len(self.title.strip()) < 3:
             raise ValueError("Task title must be at least 3 characters long")
         
-        if self.due_date and self.due_date < datetime.now():
-            if not self.id:  # Only for new tasks
-                raise ValueError("Due date cannot be in the past")
+        # Only for new tasks; entities loaded from storage skip the clock read
+        if not self.id and self.due_date and self.due_date < datetime.now(timezone.utc):
+            raise ValueError("Due date cannot be in the past")
     
     def mark_as_completed(self) -> None:
         """Mark task as completed - business rule"""
@@ -56,7 +56,7 @@ class Task:
             raise ValueError("Task is already completed")
         
         self.status = TaskStatus.COMPLETED
-        self.completed_at = datetime.now()
+        self.completed_at = datetime.now(timezone.utc)
     
     def mark_as_pending(self) -> None:
         """Mark task as pending - business rule"""
@@ -73,17 +73,17 @@ class Task:
         
         self.priority = new_priority
     
-    def is_overdue(self) -> bool:
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
         """Check if task is overdue - business logic"""
         if not self.due_date or self.status == TaskStatus.COMPLETED:
             return False
-        return datetime.now() > self.due_date
+        return (now or datetime.now(timezone.utc)) > self.due_date
     
-    def days_until_due(self) -> Optional[int]:
+    def days_until_due(self, now: Optional[datetime] = None) -> Optional[int]:
         """Calculate days until due date"""
         if not self.due_date:
             return None
-        delta = self.due_date - datetime.now()
+        delta = self.due_date - (now or datetime.now(timezone.utc))
         return delta.days
     
     def is_high_priority(self) -> bool:
@@ -96,7 +96,7 @@ class Task:
         return self.status == TaskStatus.COMPLETED
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskFilter:
     """Value object for task filtering"""
     user_id: Optional[str] = None
@@ -108,7 +108,7 @@ class TaskFilter:
     search_term: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskStatistics:
     """Value object for task statistics"""
     total_tasks: int
@@ -121,11 +121,18 @@ class TaskStatistics:
     @classmethod
     def calculate(cls, tasks: list[Task]) -> 'TaskStatistics':
         """Calculate statistics from task list"""
+        # One pass over the tasks with a single clock reading
+        now = datetime.now(timezone.utc)
         total = len(tasks)
-        completed = sum(1 for task in tasks if task.is_completed)
+        completed = overdue = high_priority = 0
+        for task in tasks:
+            if task.is_completed:
+                completed += 1
+            elif task.due_date and now > task.due_date:
+                overdue += 1
+            if task.is_high_priority():
+                high_priority += 1
         pending = total - completed
-        overdue = sum(1 for task in tasks if task.is_overdue())
-        high_priority = sum(1 for task in tasks if task.is_high_priority())
         completion_rate = (completed / total * 100) if total > 0 else 0
         
         return cls(
@@ -2,7 +2,8 @@
 Task repository interfaces - Abstract contracts for data access
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from .entities import Task, TaskFilter, TaskStatistics
 
 
@@ -24,11 +25,21 @@ class TaskRepository(ABC):
         """Find all tasks for a specific user"""
         pass
     
+    @abstractmethod
+    def find_incomplete_by_user_id(self, user_id: str) -> List[Task]:
+        """Find all tasks for a specific user that are not completed"""
+        pass
+    
     @abstractmethod
     def find_with_filter(self, task_filter: TaskFilter) -> List[Task]:
         """Find tasks with filtering criteria"""
         pass
     
+    @abstractmethod
+    def get_filter_version(self, task_filter: TaskFilter) -> Tuple[int, Optional[datetime]]:
+        """Return the count and latest update time of the tasks matching the filter"""
+        pass
+    
     @abstractmethod
     def delete(self, task_id: str) -> bool:
         """Delete a task by ID, return True if deleted"""
@@ -39,6 +50,11 @@ class TaskRepository(ABC):
         """Bulk update task status, return number of updated tasks"""
         pass
     
+    @abstractmethod
+    def complete_user_tasks(self, task_ids: List[str], user_id: str) -> List[Task]:
+        """Complete the user's incomplete tasks among task_ids, return the completed tasks"""
+        pass
+    
     @abstractmethod
     def get_statistics(self, user_id: Optional[str] = None) -> TaskStatistics:
         """Get task statistics, optionally filtered by user"""
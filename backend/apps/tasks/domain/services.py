@@ -125,17 +125,22 @@ class TaskDomainService:
         all_user_tasks = self._task_repository.find_by_user_id(completed_task.user_id)
         
         related_tasks = []
-        for task in all_user_tasks:
-            if (task.id != completed_task.id and 
-                not task.is_completed and
-                self._are_tasks_related(completed_task, task)):
-                
-                task.mark_as_completed()
-                updated_task = self._task_repository.save(task)
-                related_tasks.append(updated_task)
+        for task in self.find_related_tasks(completed_task, all_user_tasks):
+            task.mark_as_completed()
+            updated_task = self._task_repository.save(task)
+            related_tasks.append(updated_task)
         
         return related_tasks
     
+    def find_related_tasks(self, completed_task: Task, candidates: List[Task]) -> List[Task]:
+        """Pick the incomplete candidates that count as related to completed_task"""
+        return [
+            task for task in candidates
+            if (task.id != completed_task.id and
+                not task.is_completed and
+                self._are_tasks_related(completed_task, task))
+        ]
+    
     def _are_tasks_related(self, task1: Task, task2: Task) -> bool:
         """
         Determine if two tasks are related based on business rules
@@ -8,6 +8,12 @@ from .models import TaskModel
 class TaskMapper:
     """Mapper between Task entity and TaskModel"""
     
+    # Columns written by update_model_from_entity
+    UPDATE_FIELDS = [
+        'title', 'description', 'priority', 'status', 'due_date',
+        'completed_at', 'updated_at'
+    ]
+    
     def model_to_entity(self, model: TaskModel) -> Task:
         """Convert Django model to domain entity"""
         return Task(
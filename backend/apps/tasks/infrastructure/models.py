@@ -1,7 +1,9 @@
 """
 Django models for Task infrastructure layer
 """
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.core.validators import MinLengthValidator
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -23,6 +25,9 @@ class TaskModel(models.Model):
         COMPLETED = 'completed', 'Completed'
         CANCELLED = 'cancelled', 'Cancelled'
     
+    # Label lookup built once instead of walking field choices per call
+    PRIORITY_LABELS = dict(Priority.choices)
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(
         max_length=200,
@@ -72,11 +77,27 @@ class TaskModel(models.Model):
             models.Index(fields=['priority']),
             models.Index(fields=['created_at']),
             models.Index(fields=['status']),
+            # Partial index for the hot "open tasks by user ordered by due date" path
+            models.Index(
+                fields=['user_id', 'due_date'],
+                name='task_active_due_idx',
+                condition=models.Q(status__in=['pending', 'in_progress']),
+            ),
+            # Overdue lookups across all users (no user_id to lead with)
+            models.Index(
+                fields=['due_date'],
+                name='task_overdue_idx',
+                condition=models.Q(status__in=['pending', 'in_progress']),
+            ),
+            # Trigram indexes for search_term, icontains compiles to
+            # UPPER(column) LIKE UPPER(%term%) on PostgreSQL
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='task_title_trgm_idx'),
+            GinIndex(OpClass(Upper('description'), name='gin_trgm_ops'), name='task_description_trgm_idx'),
         ]
     
     def __str__(self):
         status_icon = "✓" if self.status == self.Status.COMPLETED else "○"
-        return f"{status_icon} {self.title} ({self.get_priority_display()})"
+        return f"{status_icon} {self.title} ({self.PRIORITY_LABELS.get(self.priority, self.priority)})"
     
     def clean(self):
         """Model validation"""
@@ -88,13 +109,21 @@ class TaskModel(models.Model):
         if self.title and len(self.title.strip()) < 3:
             raise ValidationError({'title': 'Title must be at least 3 characters long.'})
     
-    def save(self, *args, **kwargs):
+    def save(self, *args, update_fields=None, **kwargs):
         """Override save to handle completion timestamp"""
+        # Partial saves that leave status alone don't need to touch completed_at
+        if update_fields is None or 'status' in update_fields:
+            self.sync_completed_at()
+            if update_fields is not None:
+                update_fields = set(update_fields) | {'completed_at'}
+        super().save(*args, update_fields=update_fields, **kwargs)
+    
+    def sync_completed_at(self):
+        """Keep completed_at consistent with the current status"""
         if self.status == self.Status.COMPLETED and not self.completed_at:
             self.completed_at = timezone.now()
         elif self.status != self.Status.COMPLETED:
             self.completed_at = None
-        super().save(*args, **kwargs)
     
     @property
     def is_overdue(self):
@@ -109,4 +138,14 @@ class TaskModel(models.Model):
         if not self.due_date:
             return None
         delta = self.due_date - timezone.now()
-        return delta.days
\ No newline at end of file
+        return delta.days
+
+
+# Priorities are stored as text, so sort on their rank rather than alphabetically
+PRIORITY_RANK = models.Case(
+    models.When(priority=TaskModel.Priority.URGENT, then=models.Value(3)),
+    models.When(priority=TaskModel.Priority.HIGH, then=models.Value(2)),
+    models.When(priority=TaskModel.Priority.MEDIUM, then=models.Value(1)),
+    default=models.Value(0),
+    output_field=models.IntegerField()
+)
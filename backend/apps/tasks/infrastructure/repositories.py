@@ -1,13 +1,15 @@
 """
 Django implementation of task repositories
 """
-from typing import List, Optional
-from django.db.models import Q, Count, Case, When
+from datetime import datetime
+from typing import List, Optional, Tuple
+from django.db import transaction
+from django.db.models import Q, Count, Case, When, Max
 from django.utils import timezone
 
 from ..domain.entities import Task, TaskPriority, TaskStatus, TaskFilter, TaskStatistics
 from ..domain.repositories import TaskRepository, TaskQueryRepository
-from .models import TaskModel
+from .models import TaskModel, PRIORITY_RANK
 from .mappers import TaskMapper
 
 
@@ -20,17 +22,23 @@ class DjangoTaskRepository(TaskRepository):
     def save(self, task: Task) -> Task:
         """Save a task and return the saved entity"""
         if task.id:
-            # Update existing task
-            try:
-                model = TaskModel.objects.get(id=task.id)
-                self._mapper.update_model_from_entity(model, task)
-            except TaskModel.DoesNotExist:
+            # Update existing task in place, use cases always load the task
+            # before saving it so there is no need to fetch the row again
+            model = TaskModel(id=task.id, user_id=task.user_id, created_at=task.created_at)
+            self._mapper.update_model_from_entity(model, task)
+            model.sync_completed_at()
+            model.updated_at = timezone.now()
+            
+            updated = TaskModel.objects.filter(id=task.id).update(
+                **{field: getattr(model, field) for field in self._mapper.UPDATE_FIELDS}
+            )
+            if not updated:
                 raise ValueError(f"Task with ID {task.id} not found")
         else:
             # Create new task
             model = self._mapper.entity_to_model(task)
+            model.save()
         
-        model.save()
         return self._mapper.model_to_entity(model)
     
     def find_by_id(self, task_id: str) -> Optional[Task]:
@@ -46,8 +54,34 @@ class DjangoTaskRepository(TaskRepository):
         models = TaskModel.objects.filter(user_id=user_id).order_by('-created_at')
         return [self._mapper.model_to_entity(model) for model in models]
     
+    def find_incomplete_by_user_id(self, user_id: str) -> List[Task]:
+        """Find all tasks for a specific user that are not completed"""
+        models = TaskModel.objects.filter(user_id=user_id).exclude(
+            status=TaskModel.Status.COMPLETED
+        ).order_by('-created_at')
+        return [self._mapper.model_to_entity(model) for model in models]
+    
     def find_with_filter(self, task_filter: TaskFilter) -> List[Task]:
         """Find tasks with filtering criteria"""
+        queryset = self._filtered_queryset(task_filter)
+        
+        # Order results
+        queryset = queryset.alias(priority_rank=PRIORITY_RANK).order_by(
+            '-priority_rank', 'due_date', '-created_at'
+        )
+        
+        return [self._mapper.model_to_entity(model) for model in queryset]
+    
+    def get_filter_version(self, task_filter: TaskFilter) -> Tuple[int, Optional[datetime]]:
+        """Return the count and latest update time of the tasks matching the filter"""
+        version = self._filtered_queryset(task_filter).aggregate(
+            count=Count('id'),
+            last_updated=Max('updated_at')
+        )
+        return version['count'], version['last_updated']
+    
+    def _filtered_queryset(self, task_filter: TaskFilter):
+        """Build the queryset matching the filter criteria"""
         queryset = TaskModel.objects.all()
         
         # Apply filters
@@ -78,10 +112,7 @@ class DjangoTaskRepository(TaskRepository):
                 Q(description__icontains=task_filter.search_term)
             )
         
-        # Order results
-        queryset = queryset.order_by('-priority', 'due_date', '-created_at')
-        
-        return [self._mapper.model_to_entity(model) for model in queryset]
+        return queryset
     
     def delete(self, task_id: str) -> bool:
         """Delete a task by ID, return True if deleted"""
@@ -104,6 +135,32 @@ class DjangoTaskRepository(TaskRepository):
         
         return updated_count
     
+    def complete_user_tasks(self, task_ids: List[str], user_id: str) -> List[Task]:
+        """Complete the user's incomplete tasks among task_ids, return the completed tasks"""
+        now = timezone.now()
+        with transaction.atomic():
+            models = list(
+                TaskModel.objects.select_for_update()
+                .filter(id__in=task_ids, user_id=user_id)
+                .exclude(status=TaskModel.Status.COMPLETED)
+            )
+            if not models:
+                return []
+            
+            # queryset.update() bypasses auto_now, so updated_at is set explicitly
+            TaskModel.objects.filter(id__in=[model.id for model in models]).update(
+                status=TaskModel.Status.COMPLETED,
+                completed_at=now,
+                updated_at=now
+            )
+        
+        for model in models:
+            model.status = TaskModel.Status.COMPLETED
+            model.completed_at = now
+            model.updated_at = now
+        
+        return [self._mapper.model_to_entity(model) for model in models]
+    
     def get_statistics(self, user_id: Optional[str] = None) -> TaskStatistics:
         """Get task statistics, optionally filtered by user"""
         queryset = TaskModel.objects.all()
@@ -111,26 +168,22 @@ class DjangoTaskRepository(TaskRepository):
         if user_id:
             queryset = queryset.filter(user_id=user_id)
         
+        active_statuses = [TaskModel.Status.PENDING, TaskModel.Status.IN_PROGRESS]
+        
         stats = queryset.aggregate(
             total_tasks=Count('id'),
             completed_tasks=Count('id', filter=Q(status=TaskModel.Status.COMPLETED)),
-            pending_tasks=Count('id', filter=Q(status__in=[
-                TaskModel.Status.PENDING, 
-                TaskModel.Status.IN_PROGRESS
-            ])),
+            pending_tasks=Count('id', filter=Q(status__in=active_statuses)),
             high_priority_tasks=Count('id', filter=Q(priority__in=[
                 TaskModel.Priority.HIGH, 
                 TaskModel.Priority.URGENT
             ])),
+            overdue_tasks=Count('id', filter=Q(
+                due_date__lt=timezone.now(),
+                status__in=active_statuses
+            )),
         )
         
-        # Calculate overdue tasks
-        overdue_count = queryset.filter(
-            due_date__lt=timezone.now(),
-            status__in=[TaskModel.Status.PENDING, TaskModel.Status.IN_PROGRESS]
-        ).count()
-        
-        stats['overdue_tasks'] = overdue_count
         stats['completion_rate'] = (
             (stats['completed_tasks'] / stats['total_tasks'] * 100) 
             if stats['total_tasks'] > 0 else 0
@@ -0,0 +1,8 @@
+"""
+Django signals for Task infrastructure layer
+"""
+from django.dispatch import Signal
+
+# Sent once per bulk status change with the affected task IDs (task_ids)
+tasks_bulk_completed = Signal()
+tasks_bulk_reopened = Signal()
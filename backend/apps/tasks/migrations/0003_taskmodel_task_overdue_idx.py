@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2025-06-06 06:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_taskmodel_task_active_due_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='taskmodel',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'in_progress'])), fields=['due_date'], name='task_overdue_idx'),
+        ),
+    ]
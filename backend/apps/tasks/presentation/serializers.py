@@ -2,8 +2,15 @@
 DRF Serializers for Task presentation layer
 """
 from rest_framework import serializers
-from datetime import datetime
+from django.utils import timezone
 from ..application.dto import CreateTaskDTO, UpdateTaskDTO, TaskFilterDTO, BulkCompleteTasksDTO
+from ..domain.entities import TaskPriority, TaskStatus
+from apps.shared.presentation.validators import clean_text
+
+
+# Built once at import; ChoiceField keys its own lookup table off these
+PRIORITY_CHOICES = tuple(priority.value for priority in TaskPriority)
+STATUS_CHOICES = tuple(status.value for status in TaskStatus)
 
 
 class CreateTaskSerializer(serializers.Serializer):
@@ -11,20 +18,18 @@ class CreateTaskSerializer(serializers.Serializer):
     title = serializers.CharField(max_length=200, min_length=3)
     description = serializers.CharField(allow_blank=True, default="")
     priority = serializers.ChoiceField(
-        choices=['low', 'medium', 'high', 'urgent'],
+        choices=PRIORITY_CHOICES,
         default='medium'
     )
     due_date = serializers.DateTimeField(required=False, allow_null=True)
     
     def validate_title(self, value):
         """Validate title"""
-        if not value.strip():
-            raise serializers.ValidationError("Title cannot be empty")
-        return value.strip()
+        return clean_text(value, "Title")
     
     def validate_due_date(self, value):
         """Validate due date"""
-        if value and value < datetime.now():
+        if value and value < timezone.now():
             raise serializers.ValidationError("Due date cannot be in the past")
         return value
     
@@ -44,22 +49,18 @@ class UpdateTaskSerializer(serializers.Serializer):
     title = serializers.CharField(max_length=200, required=False)
     description = serializers.CharField(allow_blank=True, required=False)
     priority = serializers.ChoiceField(
-        choices=['low', 'medium', 'high', 'urgent'],
+        choices=PRIORITY_CHOICES,
         required=False
     )
     status = serializers.ChoiceField(
-        choices=['pending', 'in_progress', 'completed', 'cancelled'],
+        choices=STATUS_CHOICES,
         required=False
     )
     due_date = serializers.DateTimeField(required=False, allow_null=True)
     
     def validate_title(self, value):
         """Validate title"""
-        if value is not None and not value.strip():
-            raise serializers.ValidationError("Title cannot be empty")
-        if value is not None and len(value.strip()) < 3:
-            raise serializers.ValidationError("Title must be at least 3 characters long")
-        return value.strip() if value else value
+        return clean_text(value, "Title", min_length=3)
     
     def to_dto(self, task_id: str) -> UpdateTaskDTO:
         """Convert to DTO"""
@@ -92,11 +93,11 @@ class TaskSerializer(serializers.Serializer):
 class TaskFilterSerializer(serializers.Serializer):
     """Serializer for task filtering"""
     status = serializers.ChoiceField(
-        choices=['pending', 'in_progress', 'completed', 'cancelled'],
+        choices=STATUS_CHOICES,
         required=False
     )
     priority = serializers.ChoiceField(
-        choices=['low', 'medium', 'high', 'urgent'],
+        choices=PRIORITY_CHOICES,
         required=False
     )
     overdue_only = serializers.BooleanField(default=False)
@@ -1,6 +1,7 @@
 """
 DRF Views for Task presentation layer
 """
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
@@ -17,6 +18,10 @@ from ..application.use_cases import (
 )
 from ..domain.services import TaskDomainService
 from ..infrastructure.repositories import DjangoTaskRepository
+from apps.shared.presentation.conditional import list_etag, is_not_modified
+from apps.shared.infrastructure.statistics_cache import (
+    STATISTICS_CACHE_TIMEOUT, task_statistics_key, invalidate_task_statistics
+)
 from .serializers import (
     CreateTaskSerializer, UpdateTaskSerializer, TaskSerializer,
     TaskFilterSerializer, BulkCompleteTasksSerializer, TaskStatisticsSerializer,
@@ -52,15 +57,20 @@ class TaskListCreateView(APIView):
             
             filter_dto = filter_serializer.to_dto(str(request.user.id))
             
+            # Let polling clients skip the full list when nothing changed
+            etag = list_etag(request, use_case.get_version(filter_dto))
+            if is_not_modified(request, etag):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+            
             # Execute use case
             task_dtos = use_case.execute(filter_dto)
             
             # Serialize response
             serializer = TaskSerializer(task_dtos, many=True)
-            return Response(serializer.data)
+            return Response(serializer.data, headers={'ETag': etag})
             
         except Exception as e:
-            logger.error(f"Error listing tasks: {str(e)}")
+            logger.error("Error listing tasks: %s", e)
             return Response(
                 {'error': 'Unable to fetch tasks'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -88,7 +98,8 @@ class TaskListCreateView(APIView):
             
             # Serialize response
             response_serializer = TaskSerializer(task_dto)
-            logger.info(f"Task created: {task_dto.title} for user {request.user.id}")
+            logger.info("Task created: %s for user %s", task_dto.title, request.user.id)
+            invalidate_task_statistics(request.user.id)
             
             return Response(response_serializer.data, status=status.HTTP_201_CREATED)
             
@@ -98,7 +109,7 @@ class TaskListCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error creating task: {str(e)}")
+            logger.error("Error creating task: %s", e)
             return Response(
                 {'error': 'Unable to create task'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -133,7 +144,7 @@ class TaskDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
         except Exception as e:
-            logger.error(f"Error retrieving task {task_id}: {str(e)}")
+            logger.error("Error retrieving task %s: %s", task_id, e)
             return Response(
                 {'error': 'Unable to fetch task'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -150,12 +161,12 @@ class TaskDetailView(APIView):
             use_case = UpdateTaskUseCase(repository)
             
             # Debug logging
-            logger.info(f"PUT request data for task {task_id}: {request.data}")
+            logger.info("PUT request data for task %s: %s", task_id, request.data)
             
             # Validate input
             serializer = UpdateTaskSerializer(data=request.data)
             if not serializer.is_valid():
-                logger.error(f"Validation errors for task {task_id}: {serializer.errors}")
+                logger.error("Validation errors for task %s: %s", task_id, serializer.errors)
                 return Response(
                     {'error': 'Validation failed', 'details': serializer.errors},
                     status=status.HTTP_400_BAD_REQUEST
@@ -182,12 +193,13 @@ class TaskDetailView(APIView):
             
             # Serialize response
             response_serializer = TaskSerializer(task_dto)
-            logger.info(f"Task updated: {task_id}")
+            logger.info("Task updated: %s", task_id)
+            invalidate_task_statistics(request.user.id)
             
             return Response(response_serializer.data)
             
         except ValueError as e:
-            logger.error(f"ValueError updating task {task_id}: {str(e)}")
+            logger.error("ValueError updating task %s: %s", task_id, e)
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_400_BAD_REQUEST
@@ -198,7 +210,7 @@ class TaskDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
         except Exception as e:
-            logger.error(f"Error updating task {task_id}: {str(e)}")
+            logger.error("Error updating task %s: %s", task_id, e)
             return Response(
                 {'error': 'Unable to update task'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -214,7 +226,8 @@ class TaskDetailView(APIView):
             success = use_case.execute(task_id, str(request.user.id))
             
             if success:
-                logger.info(f"Task deleted: {task_id}")
+                logger.info("Task deleted: %s", task_id)
+                invalidate_task_statistics(request.user.id)
                 return Response(status=status.HTTP_204_NO_CONTENT)
             else:
                 return Response(
@@ -233,7 +246,7 @@ class TaskDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
         except Exception as e:
-            logger.error(f"Error deleting task {task_id}: {str(e)}")
+            logger.error("Error deleting task %s: %s", task_id, e)
             return Response(
                 {'error': 'Unable to delete task'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -263,7 +276,8 @@ def bulk_complete_tasks(request):
         # Execute use case
         result = use_case.execute(bulk_dto)
         
-        logger.info(f"Bulk completed {result['updated_count']} tasks for user {request.user.id}")
+        logger.info("Bulk completed %s tasks for user %s", result['updated_count'], request.user.id)
+        invalidate_task_statistics(request.user.id)
         
         # Serialize response
         response_serializer = BulkCompleteResponseSerializer(result)
@@ -275,7 +289,7 @@ def bulk_complete_tasks(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     except Exception as e:
-        logger.error(f"Error in bulk complete: {str(e)}")
+        logger.error("Error in bulk complete: %s", e)
         return Response(
             {'error': 'Unable to complete tasks'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -288,16 +302,22 @@ def bulk_complete_tasks(request):
 def task_statistics(request):
     """Get task statistics for the authenticated user"""
     try:
-        repository = DjangoTaskRepository()
-        use_case = GetTaskStatisticsUseCase(repository)
+        cache_key = task_statistics_key(request.user.id)
+        data = cache.get(cache_key)
         
-        stats_dto = use_case.execute(str(request.user.id))
+        if data is None:
+            repository = DjangoTaskRepository()
+            use_case = GetTaskStatisticsUseCase(repository)
+            
+            stats_dto = use_case.execute(str(request.user.id))
+            
+            data = dict(TaskStatisticsSerializer(stats_dto).data)
+            cache.set(cache_key, data, STATISTICS_CACHE_TIMEOUT)
         
-        serializer = TaskStatisticsSerializer(stats_dto)
-        return Response(serializer.data)
+        return Response(data)
         
     except Exception as e:
-        logger.error(f"Error getting task statistics: {str(e)}")
+        logger.error("Error getting task statistics: %s", e)
         return Response(
             {'error': 'Unable to fetch statistics'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -326,7 +346,7 @@ def user_productivity(request):
         return Response(serializer.data)
         
     except Exception as e:
-        logger.error(f"Error getting productivity metrics: {str(e)}")
+        logger.error("Error getting productivity metrics: %s", e)
         return Response(
             {'error': 'Unable to fetch productivity metrics'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -359,7 +379,7 @@ def task_suggestions(request, task_id):
             status=status.HTTP_403_FORBIDDEN
         )
     except Exception as e:
-        logger.error(f"Error getting task suggestions: {str(e)}")
+        logger.error("Error getting task suggestions: %s", e)
         return Response(
             {'error': 'Unable to fetch suggestions'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -379,12 +399,13 @@ def auto_prioritize_tasks(request):
         updated_tasks_dto = use_case.execute(str(request.user.id))
         
         serializer = TaskSerializer(updated_tasks_dto, many=True)
-        logger.info(f"Auto-prioritized {len(updated_tasks_dto)} tasks for user {request.user.id}")
+        logger.info("Auto-prioritized %s tasks for user %s", len(updated_tasks_dto), request.user.id)
+        invalidate_task_statistics(request.user.id)
         
         return Response(serializer.data)
         
     except Exception as e:
-        logger.error(f"Error auto-prioritizing tasks: {str(e)}")
+        logger.error("Error auto-prioritizing tasks: %s", e)
         return Response(
             {'error': 'Unable to auto-prioritize tasks'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
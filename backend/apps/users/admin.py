@@ -0,0 +1,41 @@
+"""
+Django admin configuration for User infrastructure layer
+"""
+from django.contrib import admin
+
+from apps.shared.infrastructure.pagination import EstimatedCountPaginator
+from .infrastructure.models import UserModel
+
+
+@admin.register(UserModel)
+class UserAdmin(admin.ModelAdmin):
+    """Admin for User persistence"""
+    
+    list_display = [
+        'name', 'email', 'status', 'is_active', 'is_email_verified',
+        'active_tasks_count', 'completed_tasks_count', 'created_at'
+    ]
+    list_filter = ['status', 'is_active', 'is_email_verified', 'created_at']
+    search_fields = ['name', 'email']
+    readonly_fields = [
+        'id', 'last_login', 'last_login_ip', 'failed_login_attempts',
+        'created_at', 'updated_at'
+    ]
+    exclude = ['password', 'groups', 'user_permissions']
+    ordering = ['name']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        """Annotate task counts so the changelist does not query per row"""
+        return super().get_queryset(request).with_task_counts()
+    
+    @admin.display(description='Active tasks', ordering='_active_tasks_count')
+    def active_tasks_count(self, obj):
+        """Display the user's active task count"""
+        return obj.active_tasks_count
+    
+    @admin.display(description='Completed tasks', ordering='_completed_tasks_count')
+    def completed_tasks_count(self, obj):
+        """Display the user's completed task count"""
+        return obj.completed_tasks_count
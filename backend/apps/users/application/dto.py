@@ -7,6 +7,15 @@ from typing import Optional
 from ..domain.entities import User, UserStatus
 
 
+# Lookup table for the string to enum conversion, built once
+_STATUS_MAP = {
+    'active': UserStatus.ACTIVE,
+    'inactive': UserStatus.INACTIVE,
+    'suspended': UserStatus.SUSPENDED,
+    'pending_verification': UserStatus.PENDING_VERIFICATION
+}
+
+
 @dataclass
 class CreateUserDTO:
     """DTO for user creation"""
@@ -43,13 +52,7 @@ class UpdateUserDTO:
         if not self.status:
             return None
         
-        status_map = {
-            'active': UserStatus.ACTIVE,
-            'inactive': UserStatus.INACTIVE,
-            'suspended': UserStatus.SUSPENDED,
-            'pending_verification': UserStatus.PENDING_VERIFICATION
-        }
-        return status_map.get(self.status.lower())
+        return _STATUS_MAP.get(self.status.lower())
 
 
 @dataclass
@@ -1,7 +1,7 @@
 """
 User use cases - Application layer orchestrating business logic
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from ..domain.entities import User, UserStatus, UserFilter
@@ -129,8 +129,19 @@ class ListUsersUseCase:
     
     def execute(self, dto: UserFilterDTO) -> List[UserDTO]:
         """Execute user listing with filters"""
-        # Convert DTO to domain filter
-        domain_filter = UserFilter(
+        # Get filtered users
+        users = self._user_repository.find_with_filter(self._to_domain_filter(dto))
+        
+        # Convert to DTOs
+        return [UserDTO.from_entity(user) for user in users]
+    
+    def get_version(self, dto: UserFilterDTO) -> Tuple[int, Optional[datetime]]:
+        """Get the count and latest update time of the listed users"""
+        return self._user_repository.get_filter_version(self._to_domain_filter(dto))
+    
+    def _to_domain_filter(self, dto: UserFilterDTO) -> UserFilter:
+        """Convert DTO to domain filter"""
+        return UserFilter(
             status=UserStatus(dto.status) if dto.status else None,
             is_email_verified=dto.is_email_verified,
             is_locked=dto.is_locked,
@@ -138,12 +149,6 @@ class ListUsersUseCase:
             created_after=dto.created_after,
             created_before=dto.created_before
         )
-        
-        # Get filtered users
-        users = self._user_repository.find_with_filter(domain_filter)
-        
-        # Convert to DTOs
-        return [UserDTO.from_entity(user) for user in users]
 
 
 class DeleteUserUseCase:
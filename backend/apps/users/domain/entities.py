@@ -131,6 +131,14 @@ class User:
             return "NORMAL"
 
 
+@dataclass
+class UserContact:
+    """Value object with the minimal data needed to contact a user"""
+    id: str
+    name: str
+    email: str
+
+
 @dataclass
 class UserFilter:
     """Value object for user filtering"""
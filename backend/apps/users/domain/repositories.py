@@ -2,8 +2,14 @@
 User repository interfaces - Abstract contracts for data access
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from .entities import User, UserFilter, UserStatistics
+from datetime import datetime
+from typing import List, Optional, Tuple
+from .entities import User, UserContact, UserFilter, UserStatistics
+
+
+class EmailAlreadyRegisteredError(ValueError):
+    """Raised by UserRepository.save when the email belongs to another user"""
+    pass
 
 
 class UserRepository(ABC):
@@ -24,11 +30,26 @@ class UserRepository(ABC):
         """Find a user by their email address"""
         pass
     
+    @abstractmethod
+    def find_by_email_with_lock_status(self, email: str) -> Optional[Tuple[User, bool]]:
+        """Find a user by email along with whether the account is currently locked"""
+        pass
+    
+    @abstractmethod
+    def find_active_contact_by_email(self, email: str) -> Optional[UserContact]:
+        """Find contact data of an active user by email address"""
+        pass
+    
     @abstractmethod
     def find_with_filter(self, user_filter: UserFilter) -> List[User]:
         """Find users with filtering criteria"""
         pass
     
+    @abstractmethod
+    def get_filter_version(self, user_filter: UserFilter) -> Tuple[int, Optional[datetime]]:
+        """Return the count and latest update time of the users matching the filter"""
+        pass
+    
     @abstractmethod
     def delete(self, user_id: str) -> bool:
         """Delete a user by ID, return True if deleted"""
@@ -39,6 +60,22 @@ class UserRepository(ABC):
         """Check if a user exists with the given email"""
         pass
     
+    @abstractmethod
+    def increment_failed_login(self, user_id: str, max_attempts: int = 5, lock_minutes: int = 30) -> None:
+        """Atomically record a failed login, locking the account at the threshold"""
+        pass
+    
+    @abstractmethod
+    def record_successful_login(
+        self,
+        user_id: str,
+        last_login: datetime,
+        ip_address: Optional[str] = None,
+        reset_failed_attempts: bool = False
+    ) -> None:
+        """Persist login information, writing only the columns that changed"""
+        pass
+    
     @abstractmethod
     def get_statistics(self) -> UserStatistics:
         """Get user statistics"""
@@ -9,6 +9,18 @@ from .entities import User, UserStatus
 from .repositories import UserRepository
 
 
+# Character class flags used by the single-pass password check
+_HAS_UPPER = 1
+_HAS_LOWER = 2
+_HAS_DIGIT = 4
+_ALL_CLASSES = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT
+_MISSING_CLASS_ERRORS = (
+    (_HAS_UPPER, "Password must contain at least one uppercase letter"),
+    (_HAS_LOWER, "Password must contain at least one lowercase letter"),
+    (_HAS_DIGIT, "Password must contain at least one digit"),
+)
+
+
 class UserDomainService:
     """Domain service for complex user business logic"""
     
@@ -18,12 +30,8 @@ class UserDomainService:
     def register_new_user(self, name: str, email: str, password: str) -> User:
         """
         Register a new user with business validation
-        Business rule: Email must be unique, password must be hashed
+        Business rule: Email must be unique (enforced on save), password must be hashed
         """
-        # Check if email already exists
-        if self._user_repository.exists_by_email(email.lower()):
-            raise ValueError("Email address is already registered")
-        
         # Hash password
         password_hash = self._hash_password(password)
         
@@ -49,29 +57,39 @@ class UserDomainService:
         Authenticate user with business rules
         Business rule: Check password, update login info, handle failed attempts
         """
-        user = self._user_repository.find_by_email(email.lower())
+        # The lock check is evaluated by the database in the same query
+        result = self._user_repository.find_by_email_with_lock_status(email)
         
-        if not user:
+        if not result:
             return None
         
+        user, is_locked = result
+        
         # Check if account is locked
-        if user.is_account_locked():
+        if is_locked:
             raise ValueError("Account is temporarily locked due to multiple failed login attempts")
         
-        # Check if user can login
-        if not user.can_login():
+        # Check if user can login (lock already ruled out above)
+        if user.status != UserStatus.ACTIVE:
             raise ValueError("Account is not active or email is not verified")
         
         # Verify password
         if not self._verify_password(password, user.password_hash):
-            # Increment failed attempts
-            user.increment_failed_login()
-            self._user_repository.save(user)
+            # Increment failed attempts in a single atomic update
+            self._user_repository.increment_failed_login(user.id)
             return None
         
-        # Successful login
+        # Successful login, persisted as a single narrow UPDATE
+        had_failed_attempts = user.failed_login_attempts > 0
+        ip_changed = bool(ip_address) and ip_address != user.last_login_ip
         user.update_last_login(ip_address)
-        return self._user_repository.save(user)
+        self._user_repository.record_successful_login(
+            user.id,
+            last_login=user.last_login,
+            ip_address=ip_address if ip_changed else None,
+            reset_failed_attempts=had_failed_attempts
+        )
+        return user
     
     def unlock_expired_accounts(self) -> List[User]:
         """
@@ -193,17 +211,9 @@ class UserDomainService:
     
     def _validate_password_strength(self, password: str) -> None:
         """Validate password strength"""
-        if len(password) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        
-        if not any(c.isupper() for c in password):
-            raise ValueError("Password must contain at least one uppercase letter")
-        
-        if not any(c.islower() for c in password):
-            raise ValueError("Password must contain at least one lowercase letter")
-        
-        if not any(c.isdigit() for c in password):
-            raise ValueError("Password must contain at least one digit")
+        error = UserValidationService.get_password_strength_error(password)
+        if error:
+            raise ValueError(error)
 
 
 class UserValidationService:
@@ -241,6 +251,33 @@ class UserValidationService:
         
         return errors
     
+    @staticmethod
+    def get_password_strength_error(password: str) -> Optional[str]:
+        """
+        Return the first password strength violation, or None if strong enough
+        Classifies every character in a single pass, stopping once all classes are seen
+        """
+        if len(password) < 8:
+            return "Password must be at least 8 characters long"
+        
+        flags = 0
+        for c in password:
+            if c.isupper():
+                flags |= _HAS_UPPER
+            elif c.islower():
+                flags |= _HAS_LOWER
+            elif c.isdigit():
+                flags |= _HAS_DIGIT
+            else:
+                continue
+            if flags == _ALL_CLASSES:
+                return None
+        
+        for flag, message in _MISSING_CLASS_ERRORS:
+            if not flags & flag:
+                return message
+        return None
+    
     @staticmethod
     def validate_user_update(original_user: User, updated_data: dict) -> List[str]:
         """
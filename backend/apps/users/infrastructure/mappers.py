@@ -8,6 +8,20 @@ from .models import UserModel
 class UserMapper:
     """Mapper between User entity and UserModel"""
     
+    # Columns read by model_to_entity
+    ENTITY_FIELDS = [
+        'id', 'name', 'email', 'password', 'status', 'is_email_verified',
+        'last_login_ip', 'failed_login_attempts', 'account_locked_until',
+        'created_at', 'updated_at', 'last_login'
+    ]
+    
+    # Columns written by update_model_from_entity
+    UPDATE_FIELDS = [
+        'name', 'email', 'password', 'status', 'is_email_verified',
+        'last_login_ip', 'failed_login_attempts', 'account_locked_until',
+        'last_login', 'is_active', 'updated_at'
+    ]
+    
     def model_to_entity(self, model: UserModel) -> User:
         """Convert Django model to domain entity"""
         return User(
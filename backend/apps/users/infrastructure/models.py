@@ -2,13 +2,46 @@
 Django models for User infrastructure layer
 """
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Lower
+from django.contrib.auth.models import AbstractUser, UserManager as DjangoUserManager
 from django.core.validators import MinLengthValidator
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 import uuid
 
 
+def _task_count_subquery(**filters):
+    """Correlated subquery counting a user's tasks matching the given filters"""
+    from apps.tasks.infrastructure.models import TaskModel
+    
+    counts = (
+        TaskModel.objects
+        .filter(user_id=OuterRef('pk'), **filters)
+        .order_by()
+        .values('user_id')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+class UserQuerySet(models.QuerySet):
+    """QuerySet with task-related annotations for User"""
+
+    def with_task_counts(self):
+        """Annotate active and completed task counts in the same query"""
+        return self.annotate(
+            _active_tasks_count=_task_count_subquery(status__in=['pending', 'in_progress']),
+            _completed_tasks_count=_task_count_subquery(status='completed'),
+        )
+
+
+class UserManager(DjangoUserManager.from_queryset(UserQuerySet)):
+    """Manager for User persistence"""
+    pass
+
+
 class UserModel(AbstractUser):
     """Django model for User persistence"""
     
@@ -61,6 +94,8 @@ class UserModel(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = UserManager()
+    
     # Use email as the username field
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['name']
@@ -78,6 +113,9 @@ class UserModel(AbstractUser):
             models.Index(fields=['account_locked_until']),
             models.Index(fields=['is_email_verified']),
         ]
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='user_email_ci_unique'),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.email})"
@@ -88,6 +126,16 @@ class UserModel(AbstractUser):
         if self.name and len(self.name.strip()) < 2:
             raise ValidationError({'name': 'Name must be at least 2 characters long.'})
     
+    def save(self, *args, **kwargs):
+        """Override save to keep emails normalized to lowercase"""
+        self.normalize_email_case()
+        super().save(*args, **kwargs)
+    
+    def normalize_email_case(self):
+        """Store emails in lowercase"""
+        if self.email:
+            self.email = self.email.lower()
+    
     @property
     def is_account_locked(self):
         """Check if account is currently locked"""
@@ -98,13 +146,21 @@ class UserModel(AbstractUser):
     @property
     def active_tasks_count(self):
         """Return count of active tasks"""
-        # This would require importing Task model
-        # For now, return 0
-        return 0
+        # Prefer the value annotated by UserQuerySet.with_task_counts()
+        count = getattr(self, '_active_tasks_count', None)
+        if count is not None:
+            return count
+        return self._tasks().filter(status__in=['pending', 'in_progress']).count()
     
     @property
     def completed_tasks_count(self):
         """Return count of completed tasks"""
-        # This would require importing Task model
-        # For now, return 0
-        return 0
\ No newline at end of file
+        count = getattr(self, '_completed_tasks_count', None)
+        if count is not None:
+            return count
+        return self._tasks().filter(status='completed').count()
+    
+    def _tasks(self):
+        """Return the queryset of tasks owned by this user"""
+        from apps.tasks.infrastructure.models import TaskModel
+        return TaskModel.objects.filter(user_id=self.pk)
\ No newline at end of file
@@ -1,13 +1,17 @@
 """
 Django implementation of user repositories
 """
-from typing import List, Optional
-from django.db.models import Q, Count
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Count, F, Case, When, Value, BooleanField, Exists, OuterRef, Max
+from django.db.models.functions import Now
 from django.utils import timezone
 
-from ..domain.entities import User, UserFilter, UserStatistics, UserStatus
-from ..domain.repositories import UserRepository, UserQueryRepository
+from ..domain.entities import User, UserContact, UserFilter, UserStatistics, UserStatus
+from ..domain.repositories import UserRepository, UserQueryRepository, EmailAlreadyRegisteredError
 from .models import UserModel
+from apps.tasks.infrastructure.models import TaskModel
 from .mappers import UserMapper
 
 
@@ -20,17 +24,32 @@ class DjangoUserRepository(UserRepository):
     def save(self, user: User) -> User:
         """Save a user and return the saved entity"""
         if user.id:
-            # Update existing user
+            # Update existing user in place, the entity already carries
+            # every mapped column so there is no need to fetch the row first
+            model = UserModel(id=user.id, created_at=user.created_at)
+            self._mapper.update_model_from_entity(model, user)
+            model.normalize_email_case()
+            model.updated_at = timezone.now()
+            
             try:
-                model = UserModel.objects.get(id=user.id)
-                self._mapper.update_model_from_entity(model, user)
-            except UserModel.DoesNotExist:
+                with transaction.atomic():
+                    updated = UserModel.objects.filter(id=user.id).update(
+                        **{field: getattr(model, field) for field in self._mapper.UPDATE_FIELDS}
+                    )
+            except IntegrityError:
+                raise EmailAlreadyRegisteredError("Email address is already registered")
+            if not updated:
                 raise ValueError(f"User with ID {user.id} not found")
         else:
-            # Create new user
+            # Create new user, relying on the unique email constraint
+            # instead of checking for an existing row first
             model = self._mapper.entity_to_model(user)
+            try:
+                with transaction.atomic():
+                    model.save()
+            except IntegrityError:
+                raise EmailAlreadyRegisteredError("Email address is already registered")
         
-        model.save()
         return self._mapper.model_to_entity(model)
     
     def find_by_id(self, user_id: str) -> Optional[User]:
@@ -49,8 +68,52 @@ class DjangoUserRepository(UserRepository):
         except UserModel.DoesNotExist:
             return None
     
+    def find_by_email_with_lock_status(self, email: str) -> Optional[Tuple[User, bool]]:
+        """Find a user by email along with whether the account is currently locked"""
+        model = UserModel.objects.filter(email=email.lower()).only(
+            *self._mapper.ENTITY_FIELDS
+        ).annotate(
+            is_locked=Case(
+                When(account_locked_until__gt=Now(), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        ).first()
+        
+        if model is None:
+            return None
+        return self._mapper.model_to_entity(model), model.is_locked
+    
+    def find_active_contact_by_email(self, email: str) -> Optional[UserContact]:
+        """Find contact data of an active user by email address"""
+        row = UserModel.objects.filter(
+            email=email.lower(), is_active=True
+        ).values('id', 'name', 'email').first()
+        
+        if row is None:
+            return None
+        return UserContact(id=str(row['id']), name=row['name'], email=row['email'])
+    
     def find_with_filter(self, user_filter: UserFilter) -> List[User]:
         """Find users with filtering criteria"""
+        # Skip the AbstractUser columns the entity never reads
+        queryset = self._filtered_queryset(user_filter).only(*self._mapper.ENTITY_FIELDS)
+        
+        # Order results
+        queryset = queryset.order_by('-created_at')
+        
+        return [self._mapper.model_to_entity(model) for model in queryset]
+    
+    def get_filter_version(self, user_filter: UserFilter) -> Tuple[int, Optional[datetime]]:
+        """Return the count and latest update time of the users matching the filter"""
+        version = self._filtered_queryset(user_filter).aggregate(
+            count=Count('id'),
+            last_updated=Max('updated_at')
+        )
+        return version['count'], version['last_updated']
+    
+    def _filtered_queryset(self, user_filter: UserFilter):
+        """Build the queryset matching the filter criteria"""
         queryset = UserModel.objects.all()
         
         # Apply filters
@@ -83,10 +146,7 @@ class DjangoUserRepository(UserRepository):
         if user_filter.created_before:
             queryset = queryset.filter(created_at__lte=user_filter.created_before)
         
-        # Order results
-        queryset = queryset.order_by('-created_at')
-        
-        return [self._mapper.model_to_entity(model) for model in queryset]
+        return queryset
     
     def delete(self, user_id: str) -> bool:
         """Delete a user by ID, return True if deleted"""
@@ -101,6 +161,49 @@ class DjangoUserRepository(UserRepository):
         """Check if a user exists with the given email"""
         return UserModel.objects.filter(email=email.lower()).exists()
     
+    def increment_failed_login(self, user_id: str, max_attempts: int = 5, lock_minutes: int = 30) -> None:
+        """Atomically record a failed login, locking the account at the threshold"""
+        # Conditions are evaluated against the pre-update row, so the attempt
+        # that reaches max_attempts is the one that locks the account
+        reaches_limit = Q(failed_login_attempts__gte=max_attempts - 1) & (
+            Q(account_locked_until__isnull=True) |
+            Q(account_locked_until__lte=timezone.now())
+        )
+        lock_until = timezone.now() + timedelta(minutes=lock_minutes)
+        
+        UserModel.objects.filter(id=user_id).update(
+            failed_login_attempts=F('failed_login_attempts') + 1,
+            account_locked_until=Case(
+                When(reaches_limit, then=Value(lock_until)),
+                default=F('account_locked_until'),
+            ),
+            status=Case(
+                When(reaches_limit, then=Value(UserModel.Status.SUSPENDED)),
+                default=F('status'),
+            ),
+            is_active=Case(
+                When(reaches_limit, then=Value(False)),
+                default=F('is_active'),
+            ),
+            updated_at=timezone.now(),
+        )
+    
+    def record_successful_login(
+        self,
+        user_id: str,
+        last_login: datetime,
+        ip_address: Optional[str] = None,
+        reset_failed_attempts: bool = False
+    ) -> None:
+        """Persist login information, writing only the columns that changed"""
+        fields = {'last_login': last_login, 'updated_at': timezone.now()}
+        if ip_address:
+            fields['last_login_ip'] = ip_address
+        if reset_failed_attempts:
+            fields['failed_login_attempts'] = 0
+        
+        UserModel.objects.filter(id=user_id).update(**fields)
+    
     def get_statistics(self) -> UserStatistics:
         """Get user statistics"""
         queryset = UserModel.objects.all()
@@ -110,22 +213,19 @@ class DjangoUserRepository(UserRepository):
             active_users=Count('id', filter=Q(status=UserModel.Status.ACTIVE)),
             inactive_users=Count('id', filter=Q(status=UserModel.Status.INACTIVE)),
             verified_users=Count('id', filter=Q(is_email_verified=True)),
+            locked_users=Count('id', filter=Q(account_locked_until__gt=timezone.now())),
+            users_with_tasks=Count('id', filter=Q(Exists(
+                TaskModel.objects.filter(user_id=OuterRef('pk'))
+            ))),
         )
         
-        # Calculate locked users
-        locked_count = queryset.filter(
-            account_locked_until__gt=timezone.now()
-        ).count()
-        
-        users_with_tasks = 0
-        
         return UserStatistics(
             total_users=stats['total_users'],
             active_users=stats['active_users'],
             inactive_users=stats['inactive_users'],
             verified_users=stats['verified_users'],
-            locked_users=locked_count,
-            users_with_tasks=users_with_tasks
+            locked_users=stats['locked_users'],
+            users_with_tasks=stats['users_with_tasks']
         )
     
     def find_locked_users(self) -> List[User]:
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2025-06-06 06:05
+
+import apps.users.infrastructure.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='usermodel',
+            managers=[
+                ('objects', apps.users.infrastructure.models.UserManager()),
+            ],
+        ),
+    ]
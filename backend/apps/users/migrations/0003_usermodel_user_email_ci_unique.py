@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2025-06-06 06:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_usermodel_managers'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='usermodel',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='user_email_ci_unique'),
+        ),
+    ]
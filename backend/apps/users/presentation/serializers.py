@@ -4,6 +4,8 @@ DRF Serializers for User presentation layer
 from rest_framework import serializers
 from datetime import datetime
 from ..application.dto import CreateUserDTO, UpdateUserDTO, UserFilterDTO, ChangePasswordDTO, EmailVerificationDTO
+from ..domain.services import UserValidationService
+from apps.shared.presentation.validators import clean_text
 
 
 class CreateUserSerializer(serializers.Serializer):
@@ -14,9 +16,7 @@ class CreateUserSerializer(serializers.Serializer):
     
     def validate_name(self, value):
         """Validate name"""
-        if not value.strip():
-            raise serializers.ValidationError("Name cannot be empty")
-        return value.strip()
+        return clean_text(value, "Name")
     
     def validate_email(self, value):
         """Validate email"""
@@ -24,17 +24,9 @@ class CreateUserSerializer(serializers.Serializer):
     
     def validate_password(self, value):
         """Validate password strength"""
-        if len(value) < 8:
-            raise serializers.ValidationError("Password must be at least 8 characters long")
-        
-        if not any(c.isupper() for c in value):
-            raise serializers.ValidationError("Password must contain at least one uppercase letter")
-        
-        if not any(c.islower() for c in value):
-            raise serializers.ValidationError("Password must contain at least one lowercase letter")
-        
-        if not any(c.isdigit() for c in value):
-            raise serializers.ValidationError("Password must contain at least one digit")
+        error = UserValidationService.get_password_strength_error(value)
+        if error:
+            raise serializers.ValidationError(error)
         
         return value
     
@@ -58,9 +50,7 @@ class UpdateUserSerializer(serializers.Serializer):
     
     def validate_name(self, value):
         """Validate name"""
-        if value is not None and not value.strip():
-            raise serializers.ValidationError("Name cannot be empty")
-        return value.strip() if value else value
+        return clean_text(value, "Name")
     
     def validate_email(self, value):
         """Validate email"""
@@ -127,17 +117,9 @@ class ChangePasswordSerializer(serializers.Serializer):
     
     def validate_new_password(self, value):
         """Validate new password strength"""
-        if len(value) < 8:
-            raise serializers.ValidationError("Password must be at least 8 characters long")
-        
-        if not any(c.isupper() for c in value):
-            raise serializers.ValidationError("Password must contain at least one uppercase letter")
-        
-        if not any(c.islower() for c in value):
-            raise serializers.ValidationError("Password must contain at least one lowercase letter")
-        
-        if not any(c.isdigit() for c in value):
-            raise serializers.ValidationError("Password must contain at least one digit")
+        error = UserValidationService.get_password_strength_error(value)
+        if error:
+            raise serializers.ValidationError(error)
         
         return value
     
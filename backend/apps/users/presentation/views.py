@@ -1,6 +1,7 @@
 """
 DRF Views for User presentation layer
 """
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
@@ -18,6 +19,10 @@ from ..application.use_cases import (
 )
 from ..domain.services import UserDomainService
 from ..infrastructure.repositories import DjangoUserRepository
+from apps.shared.presentation.conditional import list_etag, is_not_modified
+from apps.shared.infrastructure.statistics_cache import (
+    STATISTICS_CACHE_TIMEOUT, USER_STATISTICS_KEY, invalidate_user_statistics
+)
 from .serializers import (
     CreateUserSerializer, UpdateUserSerializer, UserSerializer,
     UserFilterSerializer, ChangePasswordSerializer, EmailVerificationSerializer,
@@ -53,15 +58,20 @@ class UserListCreateView(APIView):
             
             filter_dto = filter_serializer.to_dto()
             
+            # Let polling clients skip the full list when nothing changed
+            etag = list_etag(request, use_case.get_version(filter_dto))
+            if is_not_modified(request, etag):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+            
             # Execute use case
             user_dtos = use_case.execute(filter_dto)
             
             # Serialize response
             serializer = UserSerializer(user_dtos, many=True)
-            return Response(serializer.data)
+            return Response(serializer.data, headers={'ETag': etag})
             
         except Exception as e:
-            logger.error(f"Error listing users: {str(e)}")
+            logger.error("Error listing users: %s", e)
             return Response(
                 {'error': 'Unable to fetch users'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -90,7 +100,8 @@ class UserListCreateView(APIView):
             
             # Serialize response
             response_serializer = UserSerializer(user_dto)
-            logger.info(f"User created: {user_dto.name} ({user_dto.email})")
+            logger.info("User created: %s (%s)", user_dto.name, user_dto.email)
+            invalidate_user_statistics()
             
             return Response(response_serializer.data, status=status.HTTP_201_CREATED)
             
@@ -100,7 +111,7 @@ class UserListCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error creating user: {str(e)}")
+            logger.error("Error creating user: %s", e)
             return Response(
                 {'error': 'Unable to create user'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -137,7 +148,7 @@ class UserDetailView(APIView):
             return Response(serializer.data)
             
         except Exception as e:
-            logger.error(f"Error retrieving user {user_id}: {str(e)}")
+            logger.error("Error retrieving user %s: %s", user_id, e)
             return Response(
                 {'error': 'Unable to fetch user'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -171,7 +182,8 @@ class UserDetailView(APIView):
             
             # Serialize response
             response_serializer = UserSerializer(user_dto)
-            logger.info(f"User updated: {user_id}")
+            logger.info("User updated: %s", user_id)
+            invalidate_user_statistics()
             
             return Response(response_serializer.data)
             
@@ -181,7 +193,7 @@ class UserDetailView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error updating user {user_id}: {str(e)}")
+            logger.error("Error updating user %s: %s", user_id, e)
             return Response(
                 {'error': 'Unable to update user'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -204,7 +216,8 @@ class UserDetailView(APIView):
             success = use_case.execute(user_id)
             
             if success:
-                logger.info(f"User deleted: {user_id}")
+                logger.info("User deleted: %s", user_id)
+                invalidate_user_statistics()
                 return Response(status=status.HTTP_204_NO_CONTENT)
             else:
                 return Response(
@@ -218,7 +231,7 @@ class UserDetailView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error deleting user {user_id}: {str(e)}")
+            logger.error("Error deleting user %s: %s", user_id, e)
             return Response(
                 {'error': 'Unable to delete user'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -255,7 +268,7 @@ def change_password(request, user_id):
         # Execute use case
         user_dto = use_case.execute(change_dto)
         
-        logger.info(f"Password changed for user: {user_id}")
+        logger.info("Password changed for user: %s", user_id)
         
         # Serialize response
         response_serializer = UserSerializer(user_dto)
@@ -267,7 +280,7 @@ def change_password(request, user_id):
             status=status.HTTP_400_BAD_REQUEST
         )
     except Exception as e:
-        logger.error(f"Error changing password for user {user_id}: {str(e)}")
+        logger.error("Error changing password for user %s: %s", user_id, e)
         return Response(
             {'error': 'Unable to change password'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -304,7 +317,8 @@ def verify_email(request, user_id):
         # Execute use case
         user_dto = use_case.execute(verify_dto)
         
-        logger.info(f"Email verified for user: {user_id}")
+        logger.info("Email verified for user: %s", user_id)
+        invalidate_user_statistics()
         
         # Serialize response
         response_serializer = UserSerializer(user_dto)
@@ -316,7 +330,7 @@ def verify_email(request, user_id):
             status=status.HTTP_400_BAD_REQUEST
         )
     except Exception as e:
-        logger.error(f"Error verifying email for user {user_id}: {str(e)}")
+        logger.error("Error verifying email for user %s: %s", user_id, e)
         return Response(
             {'error': 'Unable to verify email'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -334,7 +348,8 @@ def unlock_account(request, user_id):
         
         user_dto = use_case.execute(user_id)
         
-        logger.info(f"Account unlocked for user: {user_id}")
+        logger.info("Account unlocked for user: %s", user_id)
+        invalidate_user_statistics()
         
         serializer = UserSerializer(user_dto)
         return Response(serializer.data)
@@ -345,7 +360,7 @@ def unlock_account(request, user_id):
             status=status.HTTP_400_BAD_REQUEST
         )
     except Exception as e:
-        logger.error(f"Error unlocking account for user {user_id}: {str(e)}")
+        logger.error("Error unlocking account for user %s: %s", user_id, e)
         return Response(
             {'error': 'Unable to unlock account'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -358,16 +373,21 @@ def unlock_account(request, user_id):
 def user_statistics(request):
     """Get user statistics (admin only)"""
     try:
-        repository = DjangoUserRepository()
-        use_case = GetUserStatisticsUseCase(repository)
+        data = cache.get(USER_STATISTICS_KEY)
         
-        stats_dto = use_case.execute()
+        if data is None:
+            repository = DjangoUserRepository()
+            use_case = GetUserStatisticsUseCase(repository)
+            
+            stats_dto = use_case.execute()
+            
+            data = dict(UserStatisticsSerializer(stats_dto).data)
+            cache.set(USER_STATISTICS_KEY, data, STATISTICS_CACHE_TIMEOUT)
         
-        serializer = UserStatisticsSerializer(stats_dto)
-        return Response(serializer.data)
+        return Response(data)
         
     except Exception as e:
-        logger.error(f"Error getting user statistics: {str(e)}")
+        logger.error("Error getting user statistics: %s", e)
         return Response(
             {'error': 'Unable to fetch statistics'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -402,7 +422,7 @@ def security_recommendations(request, user_id):
             status=status.HTTP_400_BAD_REQUEST
         )
     except Exception as e:
-        logger.error(f"Error getting security recommendations: {str(e)}")
+        logger.error("Error getting security recommendations: %s", e)
         return Response(
             {'error': 'Unable to fetch recommendations'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR